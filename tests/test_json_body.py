@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from warpsign.src.apple import apple_account_login
+from warpsign.src.ci import github
+
+PAYLOAD = {"accountName": "user@example.com", "rememberMe": True, "trustTokens": []}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_body(monkeypatch, use_orjson):
+    """Both serializers send the same JSON as bytes"""
+    if use_orjson:
+        monkeypatch.setattr(
+            apple_account_login, "orjson", pytest.importorskip("orjson")
+        )
+    else:
+        monkeypatch.setattr(apple_account_login, "orjson", None)
+
+    body = apple_account_login._json_body(PAYLOAD)
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == PAYLOAD
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_payload(monkeypatch, use_orjson):
+    """GitHub request kwargs carry the same JSON with either serializer"""
+    if use_orjson:
+        monkeypatch.setattr(github, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(github, "orjson", None)
+
+    kwargs = github._json_payload(PAYLOAD)
+
+    if use_orjson:
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert json.loads(kwargs["data"]) == PAYLOAD
+    else:
+        assert kwargs == {"json": PAYLOAD}
@@ -139,6 +139,12 @@ def add_signing_arguments(parser):
         help="Remove URL schemes registration [default: disabled]",
     )
 
+    parser.add_argument(
+        "--verbose-patching",
+        action="store_true",
+        help="Log every binary ID replacement instead of per-file totals [default: disabled]",
+    )
+
 
 def create_patching_options(args) -> PatchingOptions:
     """Convert parsed arguments to PatchingOptions"""
@@ -169,4 +175,5 @@ def create_patching_options(args) -> PatchingOptions:
             else UIStyle.AUTOMATIC
         ),
         remove_url_schemes=args.remove_url_schemes,
+        verbose_patching=args.verbose_patching,
     )
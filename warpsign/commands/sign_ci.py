@@ -134,16 +134,18 @@ def upload_certificates(gh_secrets: GitHubHandler, config: dict) -> None:
         )
         sys.exit(1)
 
-    # Upload development certificate
+    # Upload development and distribution certificates together
     dev_cert, dev_pass = read_cert_and_password(dev_path)
-    gh_secrets.update_secret("DEVELOPMENT_CERT", dev_cert)
-    gh_secrets.update_secret("DEVELOPMENT_CERT_PASSWORD", dev_pass)
-    console.print("[green]Development certificate uploaded successfully![/]")
-
-    # Upload distribution certificate
     dist_cert, dist_pass = read_cert_and_password(dist_path)
-    gh_secrets.update_secret("DISTRIBUTION_CERT", dist_cert)
-    gh_secrets.update_secret("DISTRIBUTION_CERT_PASSWORD", dist_pass)
+    gh_secrets.update_secrets(
+        {
+            "DEVELOPMENT_CERT": dev_cert,
+            "DEVELOPMENT_CERT_PASSWORD": dev_pass,
+            "DISTRIBUTION_CERT": dist_cert,
+            "DISTRIBUTION_CERT_PASSWORD": dist_pass,
+        }
+    )
+    console.print("[green]Development certificate uploaded successfully![/]")
     console.print("[green]Distribution certificate uploaded successfully![/]")
 
 
@@ -346,6 +348,8 @@ def main(parsed_args=None) -> int:
         console.print("[red]Error: --icon is not supported with CI at the moment[/]")
         return 1
 
+    gh_secrets = None
+
     try:
         # Load configuration and initialize GitHub handler
         config = load_config()  # Using our centralized config loader
@@ -367,9 +371,13 @@ def main(parsed_args=None) -> int:
 
         # Handle authentication
         cookie_content, session_content, auth_id, apple_id = handle_authentication()
-        gh_secrets.update_secret("APPLE_AUTH_COOKIES", cookie_content)
-        gh_secrets.update_secret("APPLE_AUTH_SESSION", session_content)
-        gh_secrets.update_secret("APPLE_AUTH_ID", auth_id)
+        gh_secrets.update_secrets(
+            {
+                "APPLE_AUTH_COOKIES": cookie_content,
+                "APPLE_AUTH_SESSION": session_content,
+                "APPLE_AUTH_ID": auth_id,
+            }
+        )
         console.print("[green]Successfully updated GitHub secrets![/]")
 
         # Upload certificates
@@ -434,6 +442,9 @@ def main(parsed_args=None) -> int:
         console.print(f"[red]Error: {str(e)}[/]")
         return 1
     finally:
+        # Release the GitHub handler's pooled connections
+        if gh_secrets is not None:
+            gh_secrets.close()
         # Always stop croc when we're done
         if use_croc and croc_handler:
             croc_handler.stop()
@@ -1,3 +1,4 @@
+import atexit
 import base64
 import hashlib
 import json
@@ -8,35 +9,104 @@ import requests
 import getpass
 import http.cookiejar as cookielib
 import re
+import time
+import weakref
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timezone
 from warpsign.logger import get_console
 from warpsign.src.utils.config_loader import get_session_dir, get_apple_credentials
 
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+except ImportError:
+    hashes = None
+    PBKDF2HMAC = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = get_console()
 
+# Patterns for scraping CSRF tokens out of developer portal page content
+_CSRF_RE = re.compile(rb'csrf["\']\s*:\s*["\']([^"\']+)["\']')
+_CSRF_TS_RE = re.compile(rb'csrf_ts["\']\s*:\s*["\']([^"\']+)["\']')
+
+# Chunk size for streaming pages scanned for CSRF tokens, and how many bytes of
+# the previous chunk are rescanned so tokens split across chunks still match
+CSRF_CHUNK_SIZE = 16384
+CSRF_SCAN_OVERLAP = 512
+
+# Seconds a certificates endpoint status stays valid for get_bundle_ids
+CERT_STATUS_TTL = 30
+
+
+# Auth instances whose cookies are flushed at exit, held weakly so the exit
+# hook doesn't keep them alive
+_LIVE_AUTHS: "weakref.WeakSet[AppleDeveloperAuth]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_cookies() -> None:
+    """Flush cookies of every auth instance still alive at exit"""
+    for auth in list(_LIVE_AUTHS):
+        auth._flush_cookies()
+
+
+@lru_cache(maxsize=8)
+def _session_id_for(email: str) -> str:
+    """Generate consistent session ID from email"""
+    # Use first 8 hex chars (4 bytes) of email hash for ID
+    return f"auth-{hashlib.sha256(email.encode()).digest()[:4].hex()}"
+
+
+def _json_body(payload: dict) -> bytes:
+    """Serialize a JSON request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
 
 class LoggingCookieJar(cookielib.LWPCookieJar):
+    """LWP cookie jar used for persisting Apple session cookies
+
+    Tracks whether it changed since it was last loaded or saved.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = False
+
     def set_cookie(self, cookie):
-        expires = (
-            "never"
-            if cookie.expires is None
-            else f"expires {datetime.fromtimestamp(cookie.expires, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC"
-        )
+        self.dirty = True
         return super().set_cookie(cookie)
 
+    def clear(self, domain=None, path=None, name=None):
+        self.dirty = True
+        return super().clear(domain, path, name)
+
 
 class AppleDeveloperAuth:
     """Minimal tester using iCloud's SRP implementation"""
 
     def __init__(self):
         self.session = requests.Session()
+        self.session.hooks["response"].append(self._maybe_capture_csrf)
         self.auth_endpoint = "https://idmsa.apple.com/appleauth/auth"
         self._widget_key = None
         self.csrf = None
         self.csrf_ts = None
         self.email = None  # Store email for session management
         self.session_data = {}  # Initialize empty session data
+        self._paths_cache: dict[str, tuple[str, str]] = {}
+        self._loaded_cookie_mtime: Optional[float] = None
+        self._last_cert_status: Optional[int] = None
+        self._last_cert_ts = 0.0
+        self._session_saved = False
+        _LIVE_AUTHS.add(self)
 
         # Check for custom session directory from environment or config
         session_dir = get_session_dir()
@@ -46,23 +116,42 @@ class AppleDeveloperAuth:
 
     def _get_session_id(self, email: str) -> str:
         """Generate consistent session ID from email"""
-        # Use first 8 chars of email hash for ID
-        return f"auth-{hashlib.sha256(email.encode()).hexdigest()[:8]}"
+        return _session_id_for(email)
 
     def _get_paths(self, email: str) -> tuple[str, str]:
         """Get cookie and session paths for email"""
-        session_id = self._get_session_id(email)
-        cookie_path = str(self._cookie_directory / f"{session_id}.cookies")
-        session_path = str(self._cookie_directory / f"{session_id}.session")
-        return cookie_path, session_path
+        paths = self._paths_cache.get(email)
+        if paths is None:
+            session_id = self._get_session_id(email)
+            cookie_path = str(self._cookie_directory / f"{session_id}.cookies")
+            session_path = str(self._cookie_directory / f"{session_id}.session")
+            paths = self._paths_cache[email] = (cookie_path, session_path)
+        return paths
 
     @property
     def widget_key(self) -> str:
         if not self._widget_key:
+            # Revalidate a previously saved key instead of refetching the config
+            headers = {}
+            cached_key = self.session_data.get("widget_key")
+            etag = self.session_data.get("widget_key_etag")
+            if cached_key and etag:
+                headers["If-None-Match"] = etag
+
             response = self.session.get(
-                "https://appstoreconnect.apple.com/olympus/v1/app/config?hostname=itunesconnect.apple.com"
+                "https://appstoreconnect.apple.com/olympus/v1/app/config?hostname=itunesconnect.apple.com",
+                headers=headers,
             )
-            self._widget_key = response.json().get("authServiceKey", "")
+            if response.status_code == 304:
+                self._widget_key = cached_key
+            else:
+                self._widget_key = response.json().get("authServiceKey", "")
+                self.session_data["widget_key"] = self._widget_key
+                etag = response.headers.get("ETag")
+                if etag:
+                    self.session_data["widget_key_etag"] = etag
+                else:
+                    self.session_data.pop("widget_key_etag", None)
         return self._widget_key
 
     @property
@@ -86,26 +175,73 @@ class AppleDeveloperAuth:
                 self.session_data = json.load(f)
                 # Try to load cookies if they exist
                 cookie_path = self._get_paths(self.email)[0]
-                if os.path.exists(cookie_path):
-                    self.session.cookies = LoggingCookieJar(filename=cookie_path)
-                    self.session.cookies.load(ignore_discard=True, ignore_expires=True)
+                self._load_cookies(cookie_path)
                 return True
         except Exception as e:
             console.print(f"[yellow]Failed to load session: {e}")
             self.session_data = {}
             return False
 
+    def _uses_cookie_file(self, cookie_path: str) -> bool:
+        """Check whether the session's cookie jar is backed by cookie_path"""
+        jar = self.session.cookies
+        return isinstance(jar, LoggingCookieJar) and jar.filename == cookie_path
+
+    def _load_cookies(self, cookie_path: str) -> bool:
+        """Load cookies from disk, skipping missing, empty or already loaded files"""
+        try:
+            st = os.stat(cookie_path)
+        except OSError:
+            return False
+        if st.st_size == 0:
+            return False
+
+        if not self._uses_cookie_file(cookie_path):
+            self.session.cookies = LoggingCookieJar(filename=cookie_path)
+            self._loaded_cookie_mtime = None
+        elif st.st_mtime == self._loaded_cookie_mtime:
+            return True
+
+        self.session.cookies.load(ignore_discard=True, ignore_expires=True)
+        self.session.cookies.dirty = False
+        self._loaded_cookie_mtime = st.st_mtime
+        return True
+
     def save_session(self) -> None:
         """Save session data to file."""
         console.print("Saving session to", self.session_path)
         # Don't print sensitive session data
         console.print("Session data: [dim](sensitive data hidden)[/]")
-        with open(self.session_path, "w") as f:
-            json.dump(self.session_data, f)
-        # Save ALL cookies, even if they're marked as discardable or expired
-        self.session.cookies.save(ignore_discard=True, ignore_expires=True)
+        # Serialize up front and write once, replacing atomically so a crash
+        # mid-write never leaves a truncated session file behind
+        data = json.dumps(self.session_data).encode()
+        tmp_path = self.session_path + ".tmp"
+        Path(tmp_path).write_bytes(data)
+        os.replace(tmp_path, self.session_path)
+        # Save ALL cookies, even if they're marked as discardable or expired,
+        # skipping the rewrite when nothing changed since the last load/save
+        jar = self.session.cookies
+        if not isinstance(jar, LoggingCookieJar) or jar.dirty:
+            jar.save(ignore_discard=True, ignore_expires=True)
+            jar.dirty = False
+        self._session_saved = True
+        # A new session invalidates any certificates status seen before it
+        self._last_cert_status = None
+        self._last_cert_ts = 0.0
         console.print("[green]Session saved successfully[/]")
 
+    def _flush_cookies(self) -> None:
+        """Write cookies changed after the last save_session once, at exit"""
+        jar = self.session.cookies
+        if not self._session_saved or not isinstance(jar, LoggingCookieJar):
+            return
+        if jar.dirty:
+            try:
+                jar.save(ignore_discard=True, ignore_expires=True)
+                jar.dirty = False
+            except Exception as e:
+                console.print(f"[yellow]Failed to save cookies: {e}")
+
     def check_auth_status(self) -> bool:
         """Check authentication status using certificates endpoint."""
         if not self.session_data.get("session_id") or not self.session_data.get("scnt"):
@@ -126,6 +262,7 @@ class AppleDeveloperAuth:
                 headers=headers,
             )
             console.print("Auth status check response:", response.status_code)
+            self._record_cert_status(response.status_code)
 
             if response.status_code == 403:
                 console.print("Session is valid")
@@ -137,52 +274,101 @@ class AppleDeveloperAuth:
             console.print(f"Auth status check failed: {str(e)}")
             return False
 
-    def _get_cookie_value(self, name: str) -> Optional[str]:
-        """Get cookie value by name"""
+    def _get_cookie_map(self) -> dict[str, str]:
+        """Map cookie names to values, keeping the first cookie for each name"""
+        cookie_map = {}
         for cookie in self.session.cookies:
-            if cookie.name == name:
-                return cookie.value
-        return None
+            cookie_map.setdefault(cookie.name, cookie.value)
+        return cookie_map
+
+    def _get_cookie_value(
+        self, name: str, cookie_map: Optional[dict[str, str]] = None
+    ) -> Optional[str]:
+        """Get cookie value by name, optionally from a prebuilt cookie map"""
+        if cookie_map is None:
+            cookie_map = self._get_cookie_map()
+        return cookie_map.get(name)
+
+    def _extract_csrf_streamed(self, response: requests.Response) -> None:
+        """Extract CSRF tokens from a streamed response, stopping at the first hits"""
+        buffer = bytearray()
+        found = {}
+        for chunk in response.iter_content(chunk_size=CSRF_CHUNK_SIZE):
+            # Rescan the tail of the previous chunk in case a token straddles it
+            pos = max(0, len(buffer) - CSRF_SCAN_OVERLAP)
+            buffer += chunk
+            for name, pattern in (("csrf", _CSRF_RE), ("csrf_ts", _CSRF_TS_RE)):
+                if name not in found:
+                    match = pattern.search(buffer, pos)
+                    if match:
+                        found[name] = match.group(1).decode()
+            if len(found) == 2:
+                break
+
+        if "csrf" in found:
+            self.csrf = found["csrf"]
+        if "csrf_ts" in found:
+            self.csrf_ts = found["csrf_ts"]
+
+    def _fetch_csrf(self, response: requests.Response) -> bool:
+        """Populate CSRF tokens from cookies, then headers, then page content"""
+        # Try cookies first
+        cookie_map = self._get_cookie_map()
+        self.csrf = self._get_cookie_value("csrf", cookie_map)
+        self.csrf_ts = self._get_cookie_value("csrf_ts", cookie_map)
+
+        # If not in cookies, try response headers
+        if not self.csrf:
+            self.csrf = response.headers.get("csrf")
+        if not self.csrf_ts:
+            self.csrf_ts = response.headers.get("csrf_ts")
+
+        # If still not found, try to extract from page content
+        if not self.csrf or not self.csrf_ts:
+            self._extract_csrf_streamed(response)
+
+        return bool(self.csrf and self.csrf_ts)
+
+    def _maybe_capture_csrf(self, response: requests.Response, *args, **kwargs):
+        """Response hook picking up CSRF tokens set by any developer portal call"""
+        if not response.url.startswith("https://developer.apple.com"):
+            return response
+        # Hooks run before the session jar is updated, so read response cookies
+        cookie_map = {cookie.name: cookie.value for cookie in response.cookies}
+        csrf = cookie_map.get("csrf") or response.headers.get("csrf")
+        csrf_ts = cookie_map.get("csrf_ts") or response.headers.get("csrf_ts")
+        if csrf:
+            self.csrf = csrf
+        if csrf_ts:
+            self.csrf_ts = csrf_ts
+        return response
 
     def validate_token(self) -> bool:
         """Check if current session token is still valid and fetch CSRF tokens."""
         self._log_cookies("Using these cookies for validation:")
-        if self.check_auth_status():
-            # Fetch CSRF tokens after confirming session is valid
-            response = self.session.get("https://developer.apple.com/account/resources")
-            if response.status_code == 200:
-                # Try cookies first
-                self.csrf = self._get_cookie_value("csrf")
-                self.csrf_ts = self._get_cookie_value("csrf_ts")
-
-                # If not in cookies, try response headers
-                if not self.csrf:
-                    self.csrf = response.headers.get("csrf")
-                if not self.csrf_ts:
-                    self.csrf_ts = response.headers.get("csrf_ts")
-
-                # If still not found, try to extract from page content
-                if not self.csrf or not self.csrf_ts:
-                    match = re.search(
-                        r'csrf["\']\s*:\s*["\']([^"\']+)["\']', response.text
-                    )
-                    if match:
-                        self.csrf = match.group(1)
-                    match = re.search(
-                        r'csrf_ts["\']\s*:\s*["\']([^"\']+)["\']', response.text
-                    )
-                    if match:
-                        self.csrf_ts = match.group(1)
+        self.csrf = None
+        self.csrf_ts = None
+        if not self.check_auth_status():
+            return False
 
-                if self.csrf and self.csrf_ts:
-                    console.print("[green]Successfully retrieved CSRF tokens[/]")
-                    console.print("[dim]CSRF: " + str(self.csrf) + "[/]")
-                    console.print("[dim]CSRF_TS: " + str(self.csrf_ts) + "[/]")
-                    return True
-                else:
-                    console.print("[red]Failed to retrieve CSRF tokens[/]")
+        # The response hook may already have captured both tokens from the
+        # auth check; only fetch the account page when it didn't
+        if not self.csrf or not self.csrf_ts:
+            # The page is large, so stream it and stop reading once both
+            # tokens are found
+            with self.session.get(
+                "https://developer.apple.com/account/resources", stream=True
+            ) as response:
+                if response.status_code != 200:
                     return False
-            return False
+                self._fetch_csrf(response)
+
+        if self.csrf and self.csrf_ts:
+            console.print("[green]Successfully retrieved CSRF tokens[/]")
+            console.print("[dim]CSRF: " + str(self.csrf) + "[/]")
+            console.print("[dim]CSRF_TS: " + str(self.csrf_ts) + "[/]")
+            return True
+        console.print("[red]Failed to retrieve CSRF tokens[/]")
         return False
 
     def authenticate(self, email: str, password: str) -> bool:
@@ -194,8 +380,10 @@ class AppleDeveloperAuth:
         self.client_id = self._get_session_id(email)
         cookie_path, session_path = self._get_paths(email)
 
-        # Initialize cookie jar for this email
-        self.session.cookies = LoggingCookieJar(filename=cookie_path)
+        # Initialize cookie jar for this email, reusing one load_session filled
+        if not self._uses_cookie_file(cookie_path):
+            self.session.cookies = LoggingCookieJar(filename=cookie_path)
+            self._loaded_cookie_mtime = None
         policy = cookielib.DefaultCookiePolicy(
             allowed_domains=None,
             strict_domain=False,
@@ -203,16 +391,17 @@ class AppleDeveloperAuth:
         self.session.cookies.set_policy(policy)
 
         # Try to load existing cookies
-        if os.path.exists(cookie_path):
-            try:
-                self.session.cookies.load(ignore_discard=True, ignore_expires=True)
+        try:
+            if self._load_cookies(cookie_path):
                 console.print(f"Loaded cookies for {email}")
                 self._log_cookies("Existing cookies for this account:")
-            except Exception as e:
-                console.print(f"Failed to load cookies: {e}")
+        except Exception as e:
+            console.print(f"Failed to load cookies: {e}")
 
-        # Try to load existing session data
-        if os.path.exists(session_path):
+        # Try to load existing session data, unless load_session already did
+        if self.session_data and self.session_data.get("email") == email:
+            console.print(f"Using loaded session for {email}")
+        elif os.path.exists(session_path):
             try:
                 with open(session_path) as f:
                     self.session_data = json.load(f)
@@ -228,15 +417,25 @@ class AppleDeveloperAuth:
             return True
 
         console.print("Session invalid or expired, authenticating from scratch...")
-        # Only clear session data, keep cookies
-        self.session_data = {"client_id": self.client_id, "email": email}
+        # Only clear session data, keep cookies and the cached widget key
+        self.session_data = {
+            "client_id": self.client_id,
+            "email": email,
+            **{
+                key: value
+                for key, value in self.session_data.items()
+                if key in ("widget_key", "widget_key_etag")
+            },
+        }
 
         # Password handler class from iCloud implementation
         class SrpPassword:
             def __init__(self, password: str):
                 if not isinstance(password, str):
                     raise ValueError("Password must be a string")
-                self.password = password
+                # Hash once up front and don't keep the raw password around
+                self._pw_hash = hashlib.sha256(password.encode("utf-8")).digest()
+                self.password = None
 
             def set_encrypt_info(self, salt: bytes, iterations: int, key_length: int):
                 self.salt = salt
@@ -244,7 +443,14 @@ class AppleDeveloperAuth:
                 self.key_length = key_length
 
             def encode(self):
-                password_hash = hashlib.sha256(self.password.encode("utf-8")).digest()
+                password_hash = self._pw_hash
+                if PBKDF2HMAC is not None:
+                    return PBKDF2HMAC(
+                        algorithm=hashes.SHA256(),
+                        length=self.key_length,
+                        salt=self.salt,
+                        iterations=self.iterations,
+                    ).derive(password_hash)
                 return hashlib.pbkdf2_hmac(
                     "sha256",
                     password_hash,
@@ -262,14 +468,17 @@ class AppleDeveloperAuth:
         # Start authentication
         uname, A = usr.start_authentication()
 
-        # If session_id and scnt exist, include them in headers
-        headers = {
+        # Headers shared by every signin/2FA request; only the session id and
+        # scnt change between calls
+        base_headers = {
             "Accept": "application/json, text/javascript",
             "Content-Type": "application/json",
             "X-Requested-With": "XMLHttpRequest",
             "X-Apple-Widget-Key": self.widget_key,
         }
 
+        # If session_id and scnt exist, include them in headers
+        headers = dict(base_headers)
         if self.session_data.get("session_id"):
             headers.update(
                 {
@@ -280,14 +489,16 @@ class AppleDeveloperAuth:
 
         # Send init request
         init_data = {
-            "a": base64.b64encode(A).decode(),
+            "a": base64.b64encode(A).decode("ascii"),
             "accountName": uname,
             "protocols": ["s2k", "s2k_fo"],
         }
 
         console.print("Initializing authentication...")
         init_response = self.session.post(
-            f"{self.auth_endpoint}/signin/init", headers=headers, json=init_data
+            f"{self.auth_endpoint}/signin/init",
+            headers=headers,
+            data=_json_body(init_data),
         )
 
         # Process challenge
@@ -307,8 +518,8 @@ class AppleDeveloperAuth:
         complete_data = {
             "accountName": uname,
             "c": c,
-            "m1": base64.b64encode(m1).decode(),
-            "m2": base64.b64encode(m2).decode(),
+            "m1": base64.b64encode(m1).decode("ascii"),
+            "m2": base64.b64encode(m2).decode("ascii"),
             "rememberMe": True,
         }
 
@@ -317,7 +528,7 @@ class AppleDeveloperAuth:
         complete_response = self.session.post(
             f"{self.auth_endpoint}/signin/complete",
             params={"isRememberMeEnabled": "true"},
-            json=complete_data,
+            data=_json_body(complete_data),
             headers=headers,
         )
 
@@ -342,12 +553,9 @@ class AppleDeveloperAuth:
             code = input("Enter the verification code: ")
 
             verify_headers = {
-                "Accept": "application/json, text/javascript",
-                "Content-Type": "application/json",
-                "X-Requested-With": "XMLHttpRequest",
+                **base_headers,
                 "X-Apple-ID-Session-Id": session_id,
                 "scnt": scnt,
-                "X-Apple-Widget-Key": self.widget_key,
             }
 
             verify_data = {"securityCode": {"code": code.strip()}}
@@ -356,7 +564,7 @@ class AppleDeveloperAuth:
                 # First verify the security code
                 verify_response = self.session.post(
                     f"{self.auth_endpoint}/verify/trusteddevice/securitycode",
-                    json=verify_data,
+                    data=_json_body(verify_data),
                     headers=verify_headers,
                 )
 
@@ -396,20 +604,7 @@ class AppleDeveloperAuth:
         # After successful authentication, get CSRF tokens
         response = self.session.get("https://developer.apple.com/account")
         if response.status_code == 200:
-            # Extract CSRF tokens from cookies using the correct method
-            self.csrf = self._get_cookie_value("csrf")
-            self.csrf_ts = self._get_cookie_value("csrf_ts")
-
-            if not self.csrf or not self.csrf_ts:
-                # Try to extract from page content if not in cookies
-                match = re.search(r'csrf["\']\s*:\s*["\']([^"\']+)["\']', response.text)
-                if match:
-                    self.csrf = match.group(1)
-                match = re.search(
-                    r'csrf_ts["\']\s*:\s*["\']([^"\']+)["\']', response.text
-                )
-                if match:
-                    self.csrf_ts = match.group(1)
+            self._fetch_csrf(response)
 
             # Save session data after successful authentication
             if complete_response.status_code in (200, 302):
@@ -429,8 +624,27 @@ class AppleDeveloperAuth:
 
         return complete_response.status_code in (200, 302, 409)
 
+    def _record_cert_status(self, status_code: int) -> None:
+        """Remember a valid certificates endpoint status for reuse"""
+        # Only a 403 (valid session) is reused; anything else may change as
+        # soon as the next login succeeds
+        if status_code == 403:
+            self._last_cert_status = status_code
+            self._last_cert_ts = time.monotonic()
+        else:
+            self._last_cert_status = None
+            self._last_cert_ts = 0.0
+
     def get_bundle_ids(self) -> bool:
         """Test accessing the developer portal API."""
+        # Reuse a recent certificates check instead of repeating the round-trip
+        if (
+            self._last_cert_status is not None
+            and time.monotonic() - self._last_cert_ts < CERT_STATUS_TTL
+        ):
+            console.print(f"Certificates response: {self._last_cert_status} (cached)")
+            return self._last_cert_status == 403
+
         headers = {
             "Accept": "application/json, text/plain, */*",
             "Content-Type": "application/vnd.api+json",
@@ -448,6 +662,7 @@ class AppleDeveloperAuth:
                 headers=headers,
             )
             console.print(f"Certificates response: {response.status_code}")
+            self._record_cert_status(response.status_code)
             return (
                 response.status_code == 403
             )  # 403 means we're authenticated but need team
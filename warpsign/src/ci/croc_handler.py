@@ -1,14 +1,21 @@
 import os
+import re
 import shutil
 import subprocess
-import uuid
-import time
+import secrets
+from collections import deque
 from pathlib import Path
 
 from warpsign.logger import get_console
 
 console = get_console()
 
+# Matches croc's "Received ... written to <path>" line, with or without quotes
+_WRITTEN_RE = re.compile(r'Received .* written to "?(?P<path>[^"]+?)"?\s*$')
+
+# Trailing output lines kept to report why a croc receive failed
+ERROR_TAIL_LINES = 20
+
 
 class CrocHandler:
     """Handler for croc file transfers with support for both sending and receiving."""
@@ -20,7 +27,7 @@ class CrocHandler:
             code: Optional croc code to use. If None, a new code will be generated.
         """
         # Generate a memorable code that's easy to type, or use provided code
-        self.code = code or f"warpsign-{uuid.uuid4().hex}"
+        self.code = code or f"warpsign-{secrets.token_urlsafe(8)}"
         self.process = None
         self.env = None
 
@@ -108,29 +115,41 @@ class CrocHandler:
             # Start the process and wait for it to complete
             console.print("[bold yellow]Waiting for CI to upload the signed IPA...[/]")
 
-            result = subprocess.run(
-                command, env=self.env, text=True, capture_output=True
+            # Stream croc's output so progress shows up as it happens and only
+            # the received path and a short error tail are kept in memory
+            self.process = subprocess.Popen(
+                command,
+                env=self.env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
             )
+            received_path = None
+            recent_output = deque(maxlen=ERROR_TAIL_LINES)
+            try:
+                for line in self.process.stdout:
+                    line = line.rstrip()
+                    console.print(line)
+                    recent_output.append(line)
+                    if received_path is None:
+                        match = _WRITTEN_RE.search(line)
+                        if match:
+                            received_path = Path(match.group("path"))
+                returncode = self.process.wait()
+            finally:
+                # Don't leave croc running if reading fails or is interrupted
+                self.stop()
 
             # Check if the process succeeded
-            if result.returncode != 0:
-                console.print(
-                    f"[red]Croc receive failed with code {result.returncode}[/]"
-                )
-                console.print(f"[red]Error: {result.stderr}[/]")
-                raise RuntimeError(f"Croc receive failed: {result.stderr}")
-
-            # Log the output
-            console.print(result.stdout)
-
-            # Parse the output to find the received file
-            for line in result.stdout.splitlines():
-                if "Received" in line and "written to" in line:
-                    file_path_str = line.split("written to ")[-1].strip()
-                    # Remove quotes if present
-                    if file_path_str.startswith('"') and file_path_str.endswith('"'):
-                        file_path_str = file_path_str[1:-1]
-                    return Path(file_path_str)
+            if returncode != 0:
+                error_output = "\n".join(recent_output)
+                console.print(f"[red]Croc receive failed with code {returncode}[/]")
+                console.print(f"[red]Error: {error_output}[/]")
+                raise RuntimeError(f"Croc receive failed: {error_output}")
+
+            if received_path is not None:
+                return received_path
 
             # If we can't find the file in the output, try to find any IPA in the output directory
             if output_dir:
@@ -154,20 +173,4 @@ class CrocHandler:
             except subprocess.TimeoutExpired:
                 console.print("[red]Force killing croc process...[/]")
                 self.process.kill()
-
-    def stream_output(self):
-        """Stream the output from the croc process to the console."""
-        if not self.process:
-            return
-
-        while True:
-            if self.process.poll() is not None:
-                # Process finished
-                break
-
-            output = self.process.stdout.readline()
-            if output:
-                console.print(output.rstrip())
-
-            # Sleep a bit to avoid hogging CPU
-            time.sleep(0.1)
+                self.process.wait()
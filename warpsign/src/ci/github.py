@@ -1,18 +1,116 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import json
+import random
+import re
+import shutil
+from contextlib import closing
 from nacl import encoding, public
 import uuid
-import datetime
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from zipfile import ZipFile
-from io import BytesIO
-from typing import Dict, Callable, List, Optional
+from io import TextIOWrapper
+from tempfile import SpooledTemporaryFile
+from typing import IO, Dict, Callable, Iterable, Iterator, List, Optional, Set
 
 from warpsign.logger import get_console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = get_console()
 
+# Seconds before the cached repository public key is fetched again
+PUBLIC_KEY_TTL = 3600
+
+# Maximum number of secret uploads in flight at once
+SECRET_UPLOAD_WORKERS = 4
+
+# How far before now runs are still considered when looking up a dispatch
+RUN_LOOKBACK_MINUTES = 5
+
+# Workflow polling interval bounds in seconds; the interval grows while
+# nothing changes and resets whenever the run or its steps move on
+POLL_INTERVAL_MIN = 2.0
+POLL_INTERVAL_MAX = 30.0
+POLL_BACKOFF = 1.5
+
+# Lower backoff ceilings for statuses that usually end soon, so a runner
+# picking up a queued job or an approved deployment is noticed promptly
+POLL_INTERVAL_MAX_BY_STATUS = {"queued": 5.0, "waiting": 10.0}
+
+# Times a rate-limited request is retried after waiting for the limit to reset,
+# and the longest single wait in seconds before trying again anyway
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_WAIT_MAX = 60
+
+# Base delay in seconds and cap multiplier for backing off after failed polls
+FAILURE_BACKOFF_BASE = 2.0
+FAILURE_BACKOFF_MAX_FACTOR = 16
+
+# First and longest retry interval in seconds while a dispatched run isn't
+# visible yet; it usually shows up within a couple of seconds
+RUN_LOOKUP_INTERVAL = 0.5
+RUN_LOOKUP_INTERVAL_MAX = 5.0
+
+# Jobs fetched per page when listing a run's steps; one page covers any
+# realistic signing workflow
+JOBS_PER_PAGE = 100
+# Only the latest attempt's jobs matter
+_JOBS_PARAMS = {"per_page": JOBS_PER_PAGE, "filter": "latest"}
+
+# Step fields kept from the jobs API response, with defaults for fields that
+# queued or pending steps leave out
+_STEP_DEFAULTS = {
+    "name": "Unknown step",
+    "status": "unknown",
+    "conclusion": None,
+    "number": 0,
+    "started_at": None,
+    "completed_at": None,
+}
+
+# Log file and job name of the signing job inside the run logs archive, and
+# how much of the archive is kept in memory before spilling to disk
+SIGN_LOG_NAME = "0_sign.txt"
+SIGN_JOB_NAME = "sign"
+LOGS_SPOOL_SIZE = 8 * 1024 * 1024
+LOGS_COPY_CHUNK_SIZE = 64 * 1024
+
+# Icon and colour for completed steps by conclusion
+_CONCLUSION_STYLE = {
+    "success": ("✅", "green"),
+    "failure": ("❌", "red"),
+    "cancelled": ("⚠️", "yellow"),
+}
+_DEFAULT_CONCLUSION_STYLE = ("❌", "red")
+
+# Marker and pattern for the upload URL the signing job prints to its log
+FINAL_URL_MARKER = "Final URL:"
+_FINAL_URL_RE = re.compile(re.escape(FINAL_URL_MARKER) + r"\s+(\S+)")
+
+
+def _parse_json(response: requests.Response):
+    """Parse a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _json_payload(payload) -> dict:
+    """Request kwargs sending a JSON body, serialised with orjson when installed"""
+    if orjson is None:
+        return {"json": payload}
+    return {
+        "data": orjson.dumps(payload),
+        "headers": {"Content-Type": "application/json"},
+    }
+
 
 class GitHubHandler:
     def __init__(self, owner, repo, token):
@@ -26,41 +124,135 @@ class GitHubHandler:
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
-    def get_public_key(self):
+        # Reuse connections across the many polling requests, retrying
+        # transient server errors on idempotent calls with backoff; rate
+        # limits are left to _request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=8,
+                backoff_factor=1.0,
+                status_forcelist=[500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self._pubkey_cache = None
+        self._pubkey_fetched_at = 0.0
+        # Monotonic deadline of the workflow being waited on; rate limit
+        # waits that would run past it are not retried
+        self._deadline: Optional[float] = None
+        self._pubkey_etag = None
+        self._sealed_box = None
+        # Created-after filter for run lookups, pinned when a workflow is
+        # dispatched so polling URLs stay stable and ETags can match
+        self._run_created_filter = None
+        self._known_workflows: Set[str] = set()
+        # Runs GitHub requests that overlap with the main polling request
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Last ETag and parsed body per polled URL, for conditional GETs
+        self._etag_cache: Dict[str, tuple] = {}
+        # Steps built from the last jobs response per run
+        self._steps_cache: Dict[int, tuple] = {}
+        # (name, status, conclusion) of each step as last logged per run
+        self._logged_steps_fp: Dict[int, tuple] = {}
+
+    def close(self) -> None:
+        """Close the pooled connections held by the session"""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_public_key(self, refresh: bool = False):
+        """Get the repository public key, reusing it across secret updates"""
+        if (
+            not refresh
+            and self._pubkey_cache is not None
+            and time.monotonic() - self._pubkey_fetched_at < PUBLIC_KEY_TTL
+        ):
+            return self._pubkey_cache
+
         url = (
             f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/secrets/public-key"
         )
-        response = requests.get(url, headers=self.headers)
+        headers = {}
+        if self._pubkey_cache is not None and self._pubkey_etag:
+            headers["If-None-Match"] = self._pubkey_etag
+        response = self._request("GET", url, headers=headers)
         response.raise_for_status()
-        return response.json()
+        if response.status_code != 304:
+            self._pubkey_cache = _parse_json(response)
+            self._pubkey_etag = response.headers.get("ETag")
+        self._pubkey_fetched_at = time.monotonic()
+        return self._pubkey_cache
 
     def encrypt_secret(self, public_key: str, secret_value: str) -> str:
-        public_key = public.PublicKey(
-            base64.b64decode(public_key.encode("utf-8")), encoding.RawEncoder
-        )
-        sealed_box = public.SealedBox(public_key)
+        # Reuse the sealed box while the repository key stays the same
+        cached = self._sealed_box
+        if cached is not None and cached[0] == public_key:
+            sealed_box = cached[1]
+        else:
+            sealed_box = public.SealedBox(
+                public.PublicKey(
+                    base64.b64decode(public_key.encode("utf-8")), encoding.RawEncoder
+                )
+            )
+            self._sealed_box = (public_key, sealed_box)
         encrypted = sealed_box.encrypt(secret_value.encode("utf-8"))
         return base64.b64encode(encrypted).decode("utf-8")
 
     def update_secret(self, secret_name: str, secret_value: str):
-        key_data = self.get_public_key()
-        encrypted_value = self.encrypt_secret(key_data["key"], secret_value)
-
         url = f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/secrets/{secret_name}"
-        data = {"encrypted_value": encrypted_value, "key_id": key_data["key_id"]}
 
-        response = requests.put(url, headers=self.headers, json=data)
+        key_data = self.get_public_key()
+        for refresh in (False, True):
+            if refresh:
+                # The cached key was rotated out; fetch the current one
+                key_data = self.get_public_key(refresh=True)
+            encrypted_value = self.encrypt_secret(key_data["key"], secret_value)
+            data = {"encrypted_value": encrypted_value, "key_id": key_data["key_id"]}
+            response = self._request("PUT", url, **_json_payload(data))
+            if response.status_code != 422:
+                break
+
         response.raise_for_status()
         return response.status_code in (201, 204)
 
+    def update_secrets(self, secrets: Dict[str, str]) -> bool:
+        """Update several secrets, overlapping the PUT requests"""
+        # Fetch the shared public key once up front rather than in each worker
+        self.get_public_key()
+        with ThreadPoolExecutor(
+            max_workers=min(len(secrets), SECRET_UPLOAD_WORKERS) or 1
+        ) as executor:
+            futures = [
+                executor.submit(self.update_secret, name, value)
+                for name, value in secrets.items()
+            ]
+            return all(future.result() for future in futures)
+
     def trigger_workflow(self, workflow_id: str, inputs: dict):
         """Trigger a workflow and return tracking UUID"""
         workflow_url = f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow_id}"
-        workflow_response = requests.get(workflow_url, headers=self.headers)
+        # Only check that the workflow exists the first time it's dispatched
+        if workflow_id not in self._known_workflows:
+            workflow_response = self._request("GET", workflow_url)
 
-        if workflow_response.status_code == 404:
-            raise Exception(f"Workflow file '{workflow_id}' not found in repository")
-        workflow_response.raise_for_status()
+            if workflow_response.status_code == 404:
+                raise Exception(
+                    f"Workflow file '{workflow_id}' not found in repository"
+                )
+            workflow_response.raise_for_status()
+            self._known_workflows.add(workflow_id)
 
         # Add UUID to inputs for tracking
         run_uuid = str(uuid.uuid4())
@@ -73,7 +265,7 @@ class GitHubHandler:
         console.print(f"Data: {json.dumps(data, indent=2)}")
 
         try:
-            response = requests.post(dispatch_url, headers=self.headers, json=data)
+            response = self._request("POST", dispatch_url, **_json_payload(data))
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             error_msg = f"\nRequest failed: {e}"
@@ -85,9 +277,9 @@ class GitHubHandler:
         console.print(f"\nResponse status: {response.status_code}")
         console.print(f"Response body: {response.text}")
 
-        # Add delay to allow GitHub to queue the workflow
-        console.print("\nWaiting for GitHub to queue the workflow...")
-        time.sleep(5)
+        # No fixed wait for GitHub to queue the run; wait_for_workflow polls
+        # until it shows up
+        self._run_created_filter = self._make_created_filter()
 
         return run_uuid
 
@@ -97,31 +289,27 @@ class GitHubHandler:
     def get_workflow_run(self, workflow_id: str, run_uuid=None):
         """Get the run for a workflow matching the UUID"""
         url = f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/workflows/{workflow_id}/runs"
+        # Pin the filter on first use when nothing was dispatched from here
+        if self._run_created_filter is None:
+            self._run_created_filter = self._make_created_filter()
         params = {
             "exclude_pull_requests": "true",
             "per_page": 30,  # Increased to get more runs
-            "created": f">{datetime.datetime.utcnow() - datetime.timedelta(minutes=5):%Y-%m-%dT%H:%M:%SZ}",
+            "created": self._run_created_filter,
         }
 
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-
-        runs = response.json().get("workflow_runs", [])
+        runs = self._get_json_conditional(url, params).get("workflow_runs", [])
 
         if not runs:
             return None
 
         if run_uuid:
-            # Sort runs by created_at in descending order
-            runs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
+            # The run name is the UUID in brackets, and UUIDs are unique, so
+            # the first exact match is the run regardless of order
+            run_name = f"[{run_uuid}]"
             for run in runs:
-                # Check if UUID is in the run name (format: [uuid])
-                run_name = run.get("name", "")
-                if run_name.startswith("[") and run_name.endswith("]"):
-                    workflow_uuid = run_name[1:-1]  # Remove brackets
-                    if workflow_uuid == run_uuid:
-                        return run
+                if run.get("name") == run_name:
+                    return run
 
             return None
 
@@ -132,35 +320,93 @@ class GitHubHandler:
 
         return runs[0] if runs else None
 
+    @staticmethod
+    def _make_created_filter() -> str:
+        """Build a created-after filter allowing for queueing delay and clock skew"""
+        created_after = time.gmtime(time.time() - RUN_LOOKBACK_MINUTES * 60)
+        return time.strftime(">%Y-%m-%dT%H:%M:%SZ", created_after)
+
+    def get_run(self, run_id: int) -> dict:
+        """Get a single workflow run by ID"""
+        url = f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}"
+        return self._get_json_conditional(url)
+
+    def _get_json_conditional(self, url: str, params: dict = None):
+        """GET a JSON resource, reusing the cached body when GitHub returns 304.
+
+        Unchanged resources come back as an empty 304 that doesn't count
+        against the rate limit.
+        """
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        response = self._request("GET", url, params=params, headers=headers)
+        response.raise_for_status()
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        data = _parse_json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[url] = (etag, data)
+        else:
+            self._etag_cache.pop(url, None)
+        return data
+
     # This code is awful, but it works and GitHub's API is a pain.
 
+    def _get_jobs_data(self, run_id: int) -> dict:
+        """Get the first page of a run's latest jobs"""
+        url = (
+            f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/jobs"
+        )
+        return self._get_json_conditional(url, _JOBS_PARAMS)
+
     def get_workflow_steps(self, run_id: int) -> list:
         """Get details about the steps in a workflow run"""
         url = (
             f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/jobs"
         )
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-
-        jobs_data = response.json()
-        steps = []
-
-        for job in jobs_data.get("jobs", []):
-            for step in job.get("steps", []):
-                steps.append(
-                    {
-                        "name": step.get("name", "Unknown step"),
-                        "status": step.get("status", "unknown"),
-                        "conclusion": step.get("conclusion", None),
-                        "number": step.get("number", 0),
-                        "started_at": step.get("started_at", None),
-                        "completed_at": step.get("completed_at", None),
-                    }
-                )
-
+        jobs_data = self._get_jobs_data(run_id)
+
+        # A 304 hands back the same parsed body, so reuse the steps built from
+        # it; callers can then spot "no change" with an identity check
+        cached = self._steps_cache.get(run_id)
+        if cached is not None and cached[0] is jobs_data:
+            return cached[1]
+
+        jobs = jobs_data.get("jobs", [])
+        page = 1
+        while len(jobs) < jobs_data.get("total_count", 0):
+            page += 1
+            response = self._request(
+                "GET", url, params={**_JOBS_PARAMS, "page": page}
+            )
+            response.raise_for_status()
+            more_jobs = _parse_json(response).get("jobs", [])
+            if not more_jobs:
+                break
+            jobs = jobs + more_jobs
+
+        steps = [
+            {
+                field: step.get(field, default)
+                for field, default in _STEP_DEFAULTS.items()
+            }
+            for job in jobs
+            for step in job.get("steps", [])
+        ]
+
+        self._steps_cache[run_id] = (jobs_data, steps)
         return steps
 
-    def log_current_steps(self, run_id: int, previous_steps=None, step_callbacks=None):
+    def log_current_steps(
+        self,
+        run_id: int,
+        previous_steps=None,
+        step_callbacks=None,
+        steps_future: Optional[Future] = None,
+    ):
         """Log currently running steps and trigger callbacks for specific steps.
 
         Args:
@@ -169,20 +415,46 @@ class GitHubHandler:
             step_callbacks: Dict mapping step names to callback functions.
                            Callbacks will be called with the step data as argument
                            when that step is found to be running or just completed.
+            steps_future: Optional in-flight get_workflow_steps call to use
+                          instead of fetching the steps again
         """
         try:
-            steps = self.get_workflow_steps(run_id)
+            if steps_future is not None:
+                steps = steps_future.result()
+            else:
+                steps = self.get_workflow_steps(run_id)
             if not steps:
                 return previous_steps
 
-            # Find steps that are in_progress
-            active_steps = [s for s in steps if s["status"] == "in_progress"]
-            completed_steps = [
-                s
-                for s in steps
-                if s["status"] == "completed"
-                and s["conclusion"] not in ["skipped", None]
-            ]
+            # Only name, status and conclusion drive the output, so compare
+            # those instead of the full step dicts
+            fingerprint = tuple(
+                (s["name"], s["status"], s["conclusion"]) for s in steps
+            )
+            unchanged = (
+                previous_steps is not None
+                and self._logged_steps_fp.get(run_id) == fingerprint
+            )
+            if unchanged and not step_callbacks:
+                return previous_steps
+            self._logged_steps_fp[run_id] = fingerprint
+
+            # Split out running steps and ones that completed (not skipped)
+            active_steps = []
+            completed_steps = []
+            for step in steps:
+                status = step["status"]
+                if status == "in_progress":
+                    active_steps.append(step)
+                elif status == "completed":
+                    conclusion = step["conclusion"]
+                    if conclusion is not None and conclusion != "skipped":
+                        completed_steps.append(step)
+
+            # Names of steps that had already completed at the last poll
+            prev_completed = {
+                ps["name"] for ps in previous_steps or () if ps["status"] == "completed"
+            }
 
             # Run callbacks for matching steps
             if step_callbacks:
@@ -196,9 +468,9 @@ class GitHubHandler:
                 if previous_steps:
                     for step in completed_steps:
                         step_name = step["name"]
-                        if step_name in step_callbacks and not any(
-                            ps["name"] == step_name and ps["status"] == "completed"
-                            for ps in previous_steps
+                        if (
+                            step_name in step_callbacks
+                            and step_name not in prev_completed
                         ):
                             console.print(
                                 f"\n[green]Detected step completed: {step_name}[/]"
@@ -206,7 +478,7 @@ class GitHubHandler:
                             step_callbacks[step_name](step, "completed")
 
             # Only print if there are new active steps or newly completed steps
-            if previous_steps is None or steps != previous_steps:
+            if not unchanged:
                 # Print currently running steps
                 if active_steps:
                     console.print("\n[bold blue][RUNNING STEPS][/]")
@@ -215,28 +487,25 @@ class GitHubHandler:
 
                 # Print recently completed steps (that weren't in previous update)
                 if previous_steps:
-                    new_completed = []
-                    for step in completed_steps:
-                        if not any(
-                            ps["name"] == step["name"] and ps["status"] == "completed"
-                            for ps in previous_steps
-                        ):
-                            new_completed.append(step)
+                    new_completed = [
+                        step
+                        for step in completed_steps
+                        if step["name"] not in prev_completed
+                    ]
 
                     if new_completed:
                         console.print("\n[bold green][COMPLETED STEPS][/]")
                         for step in new_completed:
-                            status_icon = (
-                                "✅" if step["conclusion"] == "success" else "❌"
-                            )
-                            status_color = (
-                                "green" if step["conclusion"] == "success" else "red"
+                            status_icon, status_color = _CONCLUSION_STYLE.get(
+                                step["conclusion"], _DEFAULT_CONCLUSION_STYLE
                             )
                             console.print(
                                 f"[{status_color}]{status_icon} {step['name']}[/]"
                             )
 
-            return steps
+            # Hand back the previous list when nothing changed so callers can
+            # tell with an identity check
+            return previous_steps if unchanged else steps
         except Exception as e:
             console.print(f"[red]Could not fetch step information: {str(e)}[/]")
             return previous_steps
@@ -257,20 +526,69 @@ class GitHubHandler:
             step_callbacks: Dict mapping step names to callback functions
                           that will be called when those steps run or complete
         """
-        import time
-
-        start_time = time.time()
+        self._deadline = time.monotonic() + timeout
+        try:
+            return self._poll_workflow(
+                workflow_id, run_uuid, self._deadline, step_callbacks
+            )
+        finally:
+            self._deadline = None
+
+    def _poll_workflow(
+        self, workflow_id: str, run_uuid: str, deadline: float, step_callbacks
+    ) -> dict:
+        """Poll a workflow run until it completes or the deadline passes"""
         last_status = None
         last_conclusion = None
         found_run_id = None
-        first_announcement = True
         previous_steps = None
+        # Look for a freshly dispatched run quickly, backing off until it
+        # appears; polling switches to POLL_INTERVAL_MIN once it's found
+        delay = RUN_LOOKUP_INTERVAL
+        consecutive_failures = 0
+
+        while time.monotonic() < deadline:
+            # While the run is in progress its steps will be needed anyway, so
+            # fetch them alongside the run instead of after it
+            steps_future = None
+            if found_run_id is not None and last_status == "in_progress":
+                steps_future = self._executor.submit(
+                    self.get_workflow_steps, found_run_id
+                )
+
+            # Get fresh run details each time, polling the run itself once
+            # it has been identified instead of listing all recent runs
+            try:
+                if found_run_id is None:
+                    run = self.get_workflow_run(workflow_id, run_uuid)
+                else:
+                    run = self.get_run(found_run_id)
+            except requests.RequestException as e:
+                response = getattr(e, "response", None)
+                retry_after = self._get_retry_after(response)
+                if retry_after is not None:
+                    # Never sleep past the caller's timeout
+                    retry_after = min(retry_after, max(deadline - time.monotonic(), 0))
+                    console.print(
+                        f"[yellow]Rate limited, retrying in {retry_after:.0f}s[/]"
+                    )
+                    time.sleep(retry_after)
+                    continue
+                # Client errors won't fix themselves; anything else is retried
+                if response is not None and response.status_code < 500:
+                    raise
+                consecutive_failures += 1
+                wait = self._failure_backoff(consecutive_failures)
+                console.print(
+                    f"[yellow]GitHub request failed ({e}), retrying in {wait:.1f}s[/]"
+                )
+                time.sleep(wait)
+                continue
+            consecutive_failures = 0
 
-        while time.time() - start_time < timeout:
-            # Get fresh run details each time
-            run = self.get_workflow_run(workflow_id, run_uuid)
             if not run:
-                time.sleep(5)
+                time.sleep(delay)
+                delay = min(delay * POLL_BACKOFF, RUN_LOOKUP_INTERVAL_MAX)
                 continue
 
             # Store the run ID once we find it
@@ -282,28 +600,18 @@ class GitHubHandler:
                     f"HTML URL: [link={run['html_url']}]{run['html_url']}[/link]"
                 )
                 console.print(f"Created at: {run['created_at']}")
-                first_announcement = False
             elif run["id"] != found_run_id:
                 # Skip if we found a different run
-                time.sleep(5)
+                time.sleep(delay)
                 continue
 
-            # Only print announcement once when we first find the run
-            if first_announcement:
-                console.print(f"\n[bold cyan][WORKFLOW RUN DETAILS][/]")
-                console.print(f"Run ID: {run['id']}")
-                console.print(
-                    f"HTML URL: [link={run['html_url']}]{run['html_url']}[/link]"
-                )
-                console.print(f"Created at: {run['created_at']}")
-                first_announcement = False
-
             # Get fresh status info
             status = run.get("status")
             conclusion = run.get("conclusion")
 
             # Only print status if it changed
-            if status != last_status or conclusion != last_conclusion:
+            changed = status != last_status or conclusion != last_conclusion
+            if changed:
                 console.print(f"\n[bold yellow][WORKFLOW STATUS UPDATE][/]")
                 console.print(f"Status: {status}")
                 if conclusion:
@@ -316,11 +624,13 @@ class GitHubHandler:
                 last_status = status
                 last_conclusion = conclusion
 
-            # Log current steps
-            if found_run_id:
-                previous_steps = self.log_current_steps(
-                    found_run_id, previous_steps, step_callbacks
+            # Log current steps; queued runs have none to report yet
+            if found_run_id and (changed or status == "in_progress"):
+                steps = self.log_current_steps(
+                    found_run_id, previous_steps, step_callbacks, steps_future
                 )
+                changed = changed or steps is not previous_steps
+                previous_steps = steps
 
             if status == "completed":
                 if conclusion == "success":
@@ -339,59 +649,181 @@ class GitHubHandler:
                         "\n[bold yellow][WARNING] Workflow was cancelled, exiting...[/]"
                     )
                     raise Exception("Workflow was cancelled")
+                # A completed run won't change again, so don't poll until the
+                # timeout; the caller reports any other conclusion
+                return run
 
-            time.sleep(5)
+            # Poll quickly around transitions and back off while idle
+            delay = (
+                POLL_INTERVAL_MIN
+                if changed
+                else min(
+                    delay * POLL_BACKOFF,
+                    POLL_INTERVAL_MAX_BY_STATUS.get(status, POLL_INTERVAL_MAX),
+                )
+            )
+            time.sleep(delay)
 
         raise TimeoutError("Workflow timed out")
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, waiting out GitHub rate limits before giving up"""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = self.session.request(method, url, **kwargs)
+            retry_after = self._get_retry_after(response)
+            if retry_after is None or attempt == RATE_LIMIT_RETRIES:
+                return response
+            # Let the caller handle it if waiting would overrun its timeout
+            if (
+                self._deadline is not None
+                and time.monotonic() + retry_after > self._deadline
+            ):
+                return response
+            response.close()
+            console.print(f"[yellow]Rate limited, retrying in {retry_after}s[/]")
+            time.sleep(retry_after)
+        return response
+
+    @staticmethod
+    def _failure_backoff(failures: int) -> float:
+        """Get a jittered exponential delay after consecutive failed polls"""
+        delay = min(
+            FAILURE_BACKOFF_BASE * 2 ** (failures - 1),
+            FAILURE_BACKOFF_BASE * FAILURE_BACKOFF_MAX_FACTOR,
+        )
+        return delay + random.uniform(0, FAILURE_BACKOFF_BASE)
+
+    @staticmethod
+    def _get_retry_after(response) -> Optional[int]:
+        """Get the capped wait in seconds requested by a rate-limited response"""
+        if response is None or response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            # 403s are only rate limits when they say so
+            if response.status_code == 403:
+                if response.headers.get("X-RateLimit-Remaining") != "0":
+                    return None
+                reset = response.headers.get("X-RateLimit-Reset")
+                if reset and reset.isdigit():
+                    wait = max(int(reset) - int(time.time()), 1)
+                    return min(wait, RATE_LIMIT_WAIT_MAX)
+            return 5
+        if not retry_after.isdigit():
+            return 5
+        return min(int(retry_after), RATE_LIMIT_WAIT_MAX)
+
     def get_workflow_outputs(self, run_id: int) -> dict:
         """Get the outputs from a workflow run"""
-        logs = self.get_run_logs(run_id)
-        for line in logs.splitlines():
-            if "Final URL: " in line:
-                url = line.split("Final URL: ", 1)[1].strip()
-                # Ignore raw variable names
-                if url and not url.startswith("$"):
-                    console.print(f"Found URL in logs: [link={url}]{url}[/link]")
-                    return {"url": url}
+        url = None
+        # The sign job's own log is plain text and far smaller than the
+        # archive of every job's logs, so try streaming it first
+        try:
+            with closing(self._iter_sign_job_log(run_id)) as lines:
+                url = self._find_final_url(lines)
+        except Exception as e:
+            console.print(f"[dim]Could not stream the sign job log: {str(e)}[/]")
+
+        if url is None:
+            archive, _ = self._download_logs_archive(run_id)
+            if archive is not None:
+                try:
+                    # Read the sign log line by line and stop at the first URL
+                    with archive, ZipFile(archive) as zip_file:
+                        with zip_file.open(SIGN_LOG_NAME) as raw_log:
+                            url = self._find_final_url(
+                                TextIOWrapper(raw_log, encoding="utf-8")
+                            )
+                except KeyError:
+                    console.print(f"[yellow]Could not find {SIGN_LOG_NAME} in logs[/]")
+                except Exception as e:
+                    console.print(f"[red]Error reading logs: {str(e)}[/]")
+
+        if url is not None:
+            console.print(f"Found URL in logs: [link={url}]{url}[/link]")
+            return {"url": url}
 
         console.print("\n[yellow]No URL found in logs.[/]")
         return {}
 
-    def get_run_logs(self, run_id: int) -> str:
-        """Get the logs from a workflow run"""
-        url = (
-            f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/logs"
+    def _iter_sign_job_log(self, run_id: int) -> Iterator[str]:
+        """Stream the plain text log of the run's sign job line by line"""
+        jobs = self._get_jobs_data(run_id).get("jobs", [])
+        job_id = next(
+            (job["id"] for job in jobs if job.get("name") == SIGN_JOB_NAME), None
         )
-        console.print(f"\nFetching logs from: [dim]{url}[/]")
+        if job_id is None:
+            return
 
-        # Get the redirect URL
-        response = requests.get(url, headers=self.headers, allow_redirects=False)
-        console.print(f"Initial response status: {response.status_code}")
-        if response.status_code != 302:
-            return "Could not fetch logs: No redirect found"
+        url = f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/jobs/{job_id}/logs"
+        console.print(f"\nStreaming sign job log from: [dim]{url}[/]")
+        with self._request("GET", url, stream=True) as response:
+            response.raise_for_status()
+            response.encoding = "utf-8"
+            yield from response.iter_lines(
+                chunk_size=LOGS_COPY_CHUNK_SIZE, decode_unicode=True
+            )
+
+    @staticmethod
+    def _find_final_url(lines: Iterable[str]) -> Optional[str]:
+        """Find the first upload URL printed in the sign log"""
+        for line in lines:
+            # Cheap substring test before running the regex
+            if FINAL_URL_MARKER not in line:
+                continue
+            match = _FINAL_URL_RE.search(line)
+            # Ignore raw variable names
+            if match and not match.group(1).startswith("$"):
+                return match.group(1)
+        return None
 
-        # Get the logs zip file from the redirect URL
-        logs_url = response.headers.get("Location")
-        console.print(f"Redirect URL: [dim]{logs_url}[/]")
-        if not logs_url:
-            return "Could not fetch logs: No download URL found"
+    def get_run_logs(self, run_id: int) -> str:
+        """Get the logs from a workflow run"""
+        archive, error = self._download_logs_archive(run_id)
+        if archive is None:
+            return error
 
         try:
-            # Download the zip file
-            console.print("Downloading logs zip file...")
-            zip_response = requests.get(logs_url)
-            zip_response.raise_for_status()
-            console.print(f"Zip download status: {zip_response.status_code}")
-
             # Extract the sign.txt file from the zip
             console.print("Opening zip file...")
-            with ZipFile(BytesIO(zip_response.content)) as zip_file:
+            with archive, ZipFile(archive) as zip_file:
                 # Look specifically for 0_sign.txt
-                if "0_sign.txt" in zip_file.namelist():
-                    return zip_file.read("0_sign.txt").decode("utf-8")
-                return "Could not find 0_sign.txt in logs"
+                try:
+                    return zip_file.read(SIGN_LOG_NAME).decode("utf-8")
+                except KeyError:
+                    return f"Could not find {SIGN_LOG_NAME} in logs"
 
         except Exception as e:
             console.print(f"[red]Error getting logs: {str(e)}[/]")
             return f"Could not fetch logs: {str(e)}"
+
+    def _download_logs_archive(self, run_id: int) -> tuple[Optional[IO[bytes]], str]:
+        """Download a run's logs zip into a spooled temporary file.
+
+        Returns:
+            The archive rewound to the start, or None and a reason on failure
+        """
+        url = (
+            f"{self.base_url}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/logs"
+        )
+        console.print(f"\nFetching logs from: [dim]{url}[/]")
+
+        try:
+            # Stream the zip to a temporary file that only spills to disk
+            # once it outgrows LOGS_SPOOL_SIZE. The API redirects to a
+            # pre-signed download URL; requests follows it and drops the
+            # GitHub token on the cross-host hop
+            console.print("Downloading logs zip file...")
+            with self._request("GET", url, stream=True) as zip_response:
+                zip_response.raise_for_status()
+                console.print(f"Zip download status: {zip_response.status_code}")
+                archive = SpooledTemporaryFile(max_size=LOGS_SPOOL_SIZE)
+                # Copy straight from the socket, undoing any transfer encoding
+                zip_response.raw.decode_content = True
+                shutil.copyfileobj(zip_response.raw, archive, LOGS_COPY_CHUNK_SIZE)
+            archive.seek(0)
+            return archive, ""
+
+        except Exception as e:
+            console.print(f"[red]Error getting logs: {str(e)}[/]")
+            return None, f"Could not fetch logs: {str(e)}"
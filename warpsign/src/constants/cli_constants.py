@@ -8,35 +8,38 @@ from rich.text import Text
 __version__ = "0.1.0"
 
 
-# Banner ASCII art
+# Banner ASCII art, built once at import
+_BANNER = Text()
+_BANNER.append(
+    "██╗    ██╗ █████╗ ██████╗ ██████╗ ███████╗██╗ ██████╗ ███╗   ██╗\n",
+    style="cyan",
+)
+_BANNER.append(
+    "██║    ██║██╔══██╗██╔══██╗██╔══██╗██╔════╝██║██╔════╝ ████╗  ██║\n",
+    style="cyan",
+)
+_BANNER.append(
+    "██║ █╗ ██║███████║██████╔╝██████╔╝███████╗██║██║  ███╗██╔██╗ ██║\n",
+    style="blue",
+)
+_BANNER.append(
+    "██║███╗██║██╔══██║██╔══██╗██╔═══╝ ╚════██║██║██║   ██║██║╚██╗██║\n",
+    style="blue",
+)
+_BANNER.append(
+    "╚███╔███╔╝██║  ██║██║  ██║██║     ███████║██║╚██████╔╝██║ ╚████║\n",
+    style="magenta",
+)
+_BANNER.append(
+    " ╚══╝╚══╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝     ╚══════╝╚═╝ ╚═════╝ ╚═╝  ╚═══╝\n",
+    style="magenta",
+)
+
+
 def get_banner_text():
     """Return the stylized banner text object."""
-    banner = Text()
-    banner.append(
-        "██╗    ██╗ █████╗ ██████╗ ██████╗ ███████╗██╗ ██████╗ ███╗   ██╗\n",
-        style="cyan",
-    )
-    banner.append(
-        "██║    ██║██╔══██╗██╔══██╗██╔══██╗██╔════╝██║██╔════╝ ████╗  ██║\n",
-        style="cyan",
-    )
-    banner.append(
-        "██║ █╗ ██║███████║██████╔╝██████╔╝███████╗██║██║  ███╗██╔██╗ ██║\n",
-        style="blue",
-    )
-    banner.append(
-        "██║███╗██║██╔══██║██╔══██╗██╔═══╝ ╚════██║██║██║   ██║██║╚██╗██║\n",
-        style="blue",
-    )
-    banner.append(
-        "╚███╔███╔╝██║  ██║██║  ██║██║     ███████║██║╚██████╔╝██║ ╚████║\n",
-        style="magenta",
-    )
-    banner.append(
-        " ╚══╝╚══╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝     ╚══════╝╚═╝ ╚═════╝ ╚═╝  ╚═══╝\n",
-        style="magenta",
-    )
-    return banner
+    # Hand out a copy so callers can't alter the shared banner
+    return _BANNER.copy()
 
 
 # Application description
@@ -1,30 +1,50 @@
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 import subprocess
+import atexit
 from warpsign.logger import get_console
-import random
-import string
+import itertools
 import re
 import tempfile
 import os
+import shlex
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+except ImportError:
+    x509 = None
+
+# Serial, common name, org unit and org parsed from each certificate file,
+# keyed by path, mtime and size so a replaced file is parsed again
+_CERT_INFO_CACHE: dict[tuple, tuple] = {}
+
+# Numbers the keychains created by this process
+_KEYCHAIN_COUNTER = itertools.count()
+
+# Printed with each command's exit code when keychain setup runs as one script
+_STEP_MARKER = "__WARPSIGN_STEP_RC="
+_STEP_END_RE = re.compile(rf"^{_STEP_MARKER}(\d+)$", re.M)
+
+# Identity hashes listed by security find-identity
+_IDENTITY_RE = re.compile(r'\d+\) ([A-F0-9]{40}) ".*?"')
+
+# Lines printed by openssl x509 -noout -serial -subject
+_OPENSSL_FIELD_RE = re.compile(r"^(serial|subject)=(.*)$", re.M)
 
 
 class CertHandler:
     """Handles code signing certificates"""
 
+    # Handlers handed out by get(), keyed by (certificate dir, type); their
+    # keychains live until the process exits
+    _shared: Dict[Tuple[str, str], "CertHandler"] = {}
+
     def __init__(self, cert_type: str = None, cert_dir: Optional[str | Path] = None):
         self.console = get_console()
-
-        # Get certificate directory from environment or parameter, ensure it's a Path
-        self.cert_dir = Path(
-            cert_dir
-            or os.getenv(
-                "WARPSIGN_CERT_DIR", Path.home() / ".warpsign" / "certificates"
-            )
-        )
-
-        # Get certificate type from environment or parameter
-        self.cert_type = cert_type or os.getenv("WARPSIGN_CERT_TYPE", "development")
+        self.cert_dir, self.cert_type = self._resolve_config(cert_type, cert_dir)
         if self.cert_type not in ["development", "distribution"]:
             raise ValueError(
                 "Certificate type must be either 'development' or 'distribution'"
@@ -37,6 +57,8 @@ class CertHandler:
         self.cert_common_name: Optional[str] = None
         self.cert_org_unit: Optional[str] = None
         self.cert_org: Optional[str] = None
+        # Search list left after removing old keychains, reused during setup
+        self._keychain_list: Optional[List[str]] = None
 
         # Clean up any old keychains first
         self._cleanup_old_keychains()
@@ -54,6 +76,44 @@ class CertHandler:
         self._load_certs()
         self._setup_keychain()
 
+    @staticmethod
+    def _resolve_config(
+        cert_type: Optional[str], cert_dir: Optional[str | Path]
+    ) -> Tuple[Path, str]:
+        """Get the certificate directory and type from parameters or environment"""
+        # Get certificate directory from environment or parameter, ensure it's a Path
+        resolved_dir = Path(
+            cert_dir
+            or os.getenv(
+                "WARPSIGN_CERT_DIR", Path.home() / ".warpsign" / "certificates"
+            )
+        )
+
+        # Get certificate type from environment or parameter
+        resolved_type = cert_type or os.getenv("WARPSIGN_CERT_TYPE", "development")
+        return resolved_dir, resolved_type
+
+    @classmethod
+    def get(
+        cls, cert_type: str = None, cert_dir: Optional[str | Path] = None
+    ) -> "CertHandler":
+        """Get a handler for the certificate, reusing its keychain if already set up"""
+        resolved_dir, resolved_type = cls._resolve_config(cert_type, cert_dir)
+        key = (str(resolved_dir), resolved_type)
+        handler = cls._shared.get(key)
+        if handler is None:
+            handler = cls(cert_type, cert_dir)
+            if not cls._shared:
+                atexit.register(cls._cleanup_shared)
+            cls._shared[key] = handler
+        return handler
+
+    @classmethod
+    def _cleanup_shared(cls) -> None:
+        """Delete the keychains of every shared handler"""
+        for handler in list(cls._shared.values()):
+            handler.cleanup(force=True)
+
     def _load_certs(self) -> None:
         """Load certificates from specified directory"""
         cert_dir = self.cert_dir / self.cert_type
@@ -70,144 +130,112 @@ class CertHandler:
     def _setup_keychain(self) -> None:
         """Create and configure temporary keychain"""
         password = "1234"  # Simple password for temp keychain
-        self.keychain = (
-            f"warpsign-{''.join(random.choices(string.ascii_lowercase, k=8))}"
-        )
+        # Unique within this process, and the PID keeps processes apart
+        self.keychain = f"warpsign-{os.getpid()}-{next(_KEYCHAIN_COUNTER):x}"
         self.console.log(f"\n[bold red]====== KEYCHAIN SETUP: {self.keychain} ======")
 
         # Get existing keychains
         self.console.log("[yellow]Getting existing keychains...")
-        keychains = self._get_keychain_list()
+        if self._keychain_list is not None:
+            keychains = list(self._keychain_list)
+        else:
+            keychains = self._get_keychain_list()
         self.console.log(f"[blue]Found keychains:[/] {keychains}")
 
-        # Create new keychain
-        self.console.log(f"[yellow]Creating keychain: {self.keychain}")
-        create_result = subprocess.run(
-            ["security", "create-keychain", "-p", password, self.keychain],
-            capture_output=True,
-            text=True,
-        )
-        if create_result.returncode != 0:
-            self.console.log(
-                f"[red]Create failed:[/]\nstdout: {create_result.stdout}\nstderr: {create_result.stderr}"
-            )
-
-        # Unlock keychain
-        self.console.log(f"[yellow]Unlocking keychain: {self.keychain}")
-        unlock_result = subprocess.run(
-            ["security", "unlock-keychain", "-p", password, self.keychain],
-            capture_output=True,
-            text=True,
-        )
-        if unlock_result.returncode != 0:
-            self.console.log(
-                f"[red]Unlock failed:[/]\nstdout: {unlock_result.stdout}\nstderr: {unlock_result.stderr}"
-            )
+        # Each step is (progress message, failure message, command); they run
+        # as one shell script to avoid spawning security once per step, and a
+        # failed step is logged without stopping the rest
+        steps = [
+            (
+                f"Creating keychain: {self.keychain}",
+                "Create failed",
+                ["security", "create-keychain", "-p", password, self.keychain],
+            ),
+            (
+                f"Unlocking keychain: {self.keychain}",
+                "Unlock failed",
+                ["security", "unlock-keychain", "-p", password, self.keychain],
+            ),
+        ]
 
         # Set as default keychain if running in GitHub Actions
         if os.getenv("USING_GH_ACTIONS") == "1":
-            self.console.log(f"[yellow]Setting as default keychain: {self.keychain}")
-            default_result = subprocess.run(
-                ["security", "default-keychain", "-s", self.keychain],
-                capture_output=True,
-                text=True,
-            )
-            if default_result.returncode != 0:
-                self.console.log(
-                    f"[red]Setting default keychain failed:[/]\nstdout: {default_result.stdout}\nstderr: {default_result.stderr}"
+            steps.append(
+                (
+                    f"Setting as default keychain: {self.keychain}",
+                    "Setting default keychain failed",
+                    ["security", "default-keychain", "-s", self.keychain],
                 )
-
-        # Set keychain settings with correct flags
-        self.console.log(f"[yellow]Setting keychain settings: {self.keychain}")
-        settings_result = subprocess.run(
-            [
-                "security",
-                "set-keychain-settings",
-                "-lut",  # lock on sleep, user lock, with timeout
-                "21600",  # 6 hour timeout
-                self.keychain,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        if settings_result.returncode != 0:
-            self.console.log(
-                f"[red]Settings failed:[/]\nstdout: {settings_result.stdout}\nstderr: {settings_result.stderr}"
             )
 
-        # Import certificate with additional flags for codesign and security access
-        self.console.log(f"[yellow]Importing certificate: {self.dist_cert}")
-        import_result = subprocess.run(
-            [
-                "security",
-                "import",
-                str(self.dist_cert),
-                "-k",
-                self.keychain,
-                "-f",
-                "pkcs12",
-                "-A",  # Allow all applications to access the keys
-                "-T",  # Specify trusted applications
-                "/usr/bin/codesign",
-                "-T",
-                "/usr/bin/security",
-                "-P",
-                self.cert_password,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        if import_result.returncode != 0:
-            self.console.log(f"[red]Import failed:[/]\nstdout: {import_result.stdout}")
-
-        # Allow codesign to access keychain without prompting - corrected version
-        self.console.log("[yellow]Setting keychain partition list")
-        partition_result = subprocess.run(
-            [
-                "security",
-                "set-key-partition-list",
-                "-S",
-                "apple-tool:,apple:",  # Removed codesign: from partition list
-                "-k",
-                password,
-                self.keychain,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        if partition_result.returncode != 0:
-            self.console.log(
-                f"[red]Partition list setup failed:[/]\nstdout: {partition_result.stdout}\nstderr: {partition_result.stderr}"
-            )
+        # list-keychains reports full paths such as .../login.keychain-db, so
+        # only add the login keychain by name when it isn't listed already
+        search_list = [*keychains, self.keychain]
+        if not any(Path(k).name.startswith("login.keychain") for k in keychains):
+            search_list.append("login.keychain")
+        search_list = list(dict.fromkeys(search_list))
+        steps += [
+            # Set keychain settings with correct flags
+            (
+                f"Setting keychain settings: {self.keychain}",
+                "Settings failed",
+                [
+                    "security",
+                    "set-keychain-settings",
+                    "-lut",  # lock on sleep, user lock, with timeout
+                    "21600",  # 6 hour timeout
+                    self.keychain,
+                ],
+            ),
+            # Import certificate with additional flags for codesign and security access
+            (
+                f"Importing certificate: {self.dist_cert}",
+                "Import failed",
+                [
+                    "security",
+                    "import",
+                    str(self.dist_cert),
+                    "-k",
+                    self.keychain,
+                    "-f",
+                    "pkcs12",
+                    "-A",  # Allow all applications to access the keys
+                    "-T",  # Specify trusted applications
+                    "/usr/bin/codesign",
+                    "-T",
+                    "/usr/bin/security",
+                    "-P",
+                    self.cert_password,
+                ],
+            ),
+            # Allow codesign to access keychain without prompting - corrected version
+            (
+                "Setting keychain partition list",
+                "Partition list setup failed",
+                [
+                    "security",
+                    "set-key-partition-list",
+                    "-S",
+                    "apple-tool:,apple:",  # Removed codesign: from partition list
+                    "-k",
+                    password,
+                    self.keychain,
+                ],
+            ),
+            # Add to the search list in one go, keeping the existing keychains
+            # and login.keychain alongside the new one
+            (
+                f"Adding to keychain search list: {self.keychain}",
+                "Search list update failed",
+                ["security", "list-keychains", "-d", "user", "-s", *search_list],
+            ),
+        ]
 
-        # Add to search list
-        self.console.log(f"[yellow]Adding to keychain search list: {self.keychain}")
-        keychains.append(self.keychain)
-        search_result = subprocess.run(
-            ["security", "list-keychains", "-d", "user", "-s", *keychains],
-            capture_output=True,
-            text=True,
-        )
-        if search_result.returncode != 0:
-            self.console.log(
-                f"[red]Search list update failed:[/]\nstdout: {search_result.stdout}\nstderr: {search_result.stderr}"
-            )
-
-        # Update keychain list with both the new keychain and login.keychain
-        self.console.log("[yellow]Updating keychain list")
-        subprocess.run(
-            [
-                "security",
-                "list-keychains",
-                "-d",
-                "user",
-                "-s",
-                self.keychain,
-                "login.keychain",
-            ],
-            check=True,
-            capture_output=True,
-        )
+        results = self._run_security_steps([cmd for _, _, cmd in steps])
+        for (message, failure, _), (returncode, output) in zip(steps, results):
+            self.console.log(f"[yellow]{message}")
+            if returncode != 0:
+                self.console.log(f"[red]{failure}:[/]\nstderr: {output}")
 
         # After certificate import, extract info and setup codesigning
         self._extract_certificate_info()
@@ -215,10 +243,45 @@ class CertHandler:
 
         self.console.log("[bold green]====== KEYCHAIN SETUP COMPLETE ======\n")
 
+    def _run_security_steps(self, commands: List[List[str]]) -> List[Tuple[int, str]]:
+        """Run commands in a single shell, returning each one's exit code and stderr"""
+        script = "\n".join(
+            f"{shlex.join(cmd)} 2>&1 >/dev/null; printf '\\n{_STEP_MARKER}%s\\n' $?"
+            for cmd in commands
+        )
+        result = subprocess.run(
+            ["/bin/bash", "-c", script], capture_output=True, text=True
+        )
+
+        results = []
+        offset = 0
+        for match in _STEP_END_RE.finditer(result.stdout):
+            output = result.stdout[offset : match.start()].strip()
+            results.append((int(match.group(1)), output))
+            offset = match.end()
+
+        # A shell that died early leaves the remaining steps unrun
+        while len(results) < len(commands):
+            results.append((result.returncode or 1, result.stderr.strip()))
+        return results
+
     def _extract_certificate_info(self) -> None:
         """Extract all certificate information from the keychain"""
         self.console.log("[yellow]Extracting certificate information...")
 
+        stat = self.dist_cert.stat()
+        cache_key = (str(self.dist_cert), stat.st_mtime_ns, stat.st_size)
+        cached = _CERT_INFO_CACHE.get(cache_key)
+        if cached is not None:
+            (
+                self.cert_serial,
+                self.cert_common_name,
+                self.cert_org_unit,
+                self.cert_org,
+            ) = cached
+            self._log_certificate_info()
+            return
+
         result = subprocess.run(
             ["security", "find-certificate", "-a", "-p", self.keychain],
             capture_output=True,
@@ -226,42 +289,55 @@ class CertHandler:
             check=True,
         )
 
-        # Write cert to temp file and extract all info while file is open
-        with tempfile.NamedTemporaryFile(suffix=".pem", mode="w") as temp_pem:
-            temp_pem.write(result.stdout)
-            temp_pem.flush()
-
-            # Extract serial number
-            self._extract_serial_number(temp_pem.name)
-            # Extract subject information
-            self._extract_subject_info(temp_pem.name)
+        if x509 is not None:
+            # Parse the PEM in-process instead of running openssl on it
+            self._parse_certificate(result.stdout)
+        else:
+            # Pipe the PEM into a single openssl call for both fields
+            self._extract_with_openssl(result.stdout)
+
+        _CERT_INFO_CACHE[cache_key] = (
+            self.cert_serial,
+            self.cert_common_name,
+            self.cert_org_unit,
+            self.cert_org,
+        )
 
         # Log certificate information (no sensitive data)
         self._log_certificate_info()
 
-    def _extract_serial_number(self, pem_path: str) -> None:
-        """Extract certificate serial number"""
-        result = subprocess.run(
-            ["openssl", "x509", "-noout", "-serial", "-in", pem_path],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        self.cert_serial = result.stdout.strip().split("=")[1]
+    def _parse_certificate(self, pem: str) -> None:
+        """Extract serial number and subject from the first PEM certificate"""
+        cert = x509.load_pem_x509_certificate(pem.encode())
+
+        # Match openssl's serial formatting: uppercase hex in whole bytes
+        serial = f"{cert.serial_number:X}"
+        self.cert_serial = serial.zfill(len(serial) + len(serial) % 2)
 
-    def _extract_subject_info(self, pem_path: str) -> None:
-        """Extract and parse certificate subject information"""
+        for attr in cert.subject:
+            if attr.oid == NameOID.COMMON_NAME:
+                self.cert_common_name = attr.value.split(":")[0].strip()
+            elif attr.oid == NameOID.ORGANIZATIONAL_UNIT_NAME:
+                self.cert_org_unit = attr.value
+            elif attr.oid == NameOID.ORGANIZATION_NAME:
+                self.cert_org = attr.value
+
+    def _extract_with_openssl(self, pem: str) -> None:
+        """Extract serial number and subject information using openssl"""
         result = subprocess.run(
-            ["openssl", "x509", "-noout", "-subject", "-in", pem_path],
+            ["openssl", "x509", "-noout", "-serial", "-subject"],
+            input=pem,
             capture_output=True,
             text=True,
             check=True,
         )
+        fields = dict(_OPENSSL_FIELD_RE.findall(result.stdout))
+        self.cert_serial = fields["serial"].strip()
+        self._parse_subject(fields.get("subject", ""))
 
-        # Parse the subject string
-        subject = result.stdout.strip()
-        if subject.startswith("subject="):
-            subject = subject[8:].strip()
+    def _parse_subject(self, subject: str) -> None:
+        """Parse an openssl subject line into the certificate name fields"""
+        subject = subject.strip()
 
         # Split fields by comma and parse each one
         fields = {}
@@ -301,7 +377,7 @@ class CertHandler:
             capture_output=True,
             text=True,
         )
-        identities = re.findall(r'\d+\) ([A-F0-9]{40}) ".*?"', result.stdout)
+        identities = _IDENTITY_RE.findall(result.stdout)
         if not identities:
             self.console.log("[red]NO VALID CODESIGNING IDENTITY FOUND!")
             raise Exception("No valid code signing identity found in certificate")
@@ -314,41 +390,73 @@ class CertHandler:
 
     def _test_codesign(self) -> None:
         """Test codesigning with a temporary file"""
+        if os.getenv("WARPSIGN_SKIP_TEST_SIGN") == "1":
+            return
+
         self.console.log("[yellow]Testing codesign access...")
         with tempfile.NamedTemporaryFile() as test_file:
             test_file.write(b"test")
             test_file.flush()
-            try:
-                test_result = subprocess.run(
-                    ["codesign", "-s", self.signing_identity, test_file.name],
-                    capture_output=True,
-                    text=True,
-                )
-                self.console.log(f"[green]Codesign test succeeded[/]")
-            except subprocess.CalledProcessError as e:
+            test_result = subprocess.run(
+                ["codesign", "-s", self.signing_identity, test_file.name],
+                capture_output=True,
+                text=True,
+            )
+            if test_result.returncode == 0:
+                self.console.log("[green]Codesign test succeeded[/]")
+            else:
                 self.console.log(
-                    f"[red]Codesign test failed:[/]\nstdout: {e.stdout}\nstderr: {e.stderr}"
+                    f"[red]Codesign test failed:[/]\nstdout: {test_result.stdout}\nstderr: {test_result.stderr}"
                 )
 
     def cleanup(self, force: bool = False) -> None:
-        """Explicitly clean up keychain - call this instead of relying on __del__"""
+        """Explicitly clean up keychain - call this instead of relying on __del__
+
+        Shared handlers keep their keychain for reuse unless forced; it is
+        removed when the process exits.
+        """
         if not self.keychain:
             return
 
+        key = next((k for k, h in self._shared.items() if h is self), None)
+        if key is not None:
+            if not force:
+                return
+            del self._shared[key]
+
         try:
             # Remove from search list
             keychains = self._get_keychain_list()
             keychains = [k for k in keychains if self.keychain not in k]
-            subprocess.run(
-                ["security", "list-keychains", "-d", "user", "-s", *keychains]
+            result = self._run_security(
+                "list-keychains", "-d", "user", "-s", *keychains
             )
+            if result.returncode != 0:
+                self.console.log(
+                    f"[red]Search list update failed:[/]\nstderr: {result.stderr}"
+                )
 
             # Always delete the keychain
-            subprocess.run(["security", "delete-keychain", self.keychain])
+            result = self._run_security("delete-keychain", self.keychain)
+            if result.returncode != 0:
+                self.console.log(
+                    f"[red]Failed to delete keychain {self.keychain}:[/] {result.stderr}"
+                )
+                return
+            self.keychain = None
             self.console.log("[green]Cleaned up keychain[/]")
         except Exception as e:
             self.console.log(f"[red]Error during keychain cleanup:[/] {e}")
 
+    def _run_security(self, *args: str) -> subprocess.CompletedProcess:
+        """Run a security command whose output is only needed if it fails"""
+        return subprocess.run(
+            ["security", *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
     def _get_keychain_list(self) -> List[str]:
         """Get list of current keychains"""
         result = subprocess.run(
@@ -361,18 +469,31 @@ class CertHandler:
 
     def _cleanup_old_keychains(self) -> None:
         """Remove any existing warpsign keychains"""
-        for keychain in self._get_keychain_list():
-            if "warpsign-" in keychain:
+        # Stale keychains went when the first shared handler was set up, and
+        # the shared keychains themselves are still in use
+        if self._shared:
+            return
+
+        keychains = self._get_keychain_list()
+        stale = [k for k in keychains if "warpsign-" in k]
+        if stale:
+            for keychain in stale:
                 self.console.log(f"[yellow]Cleaning up old keychain:[/] {keychain}")
-                try:
-                    subprocess.run(
-                        ["security", "delete-keychain", keychain], check=True
-                    )
-                except Exception as e:
+            results = self._run_security_steps(
+                [["security", "delete-keychain", k] for k in stale]
+            )
+            for keychain, (returncode, stderr) in zip(stale, results):
+                if returncode == 0:
+                    # Deleting a keychain also drops it from the search list
+                    keychains.remove(keychain)
+                else:
                     self.console.log(
-                        f"[red]Failed to delete keychain {keychain}:[/] {e}"
+                        f"[red]Failed to delete keychain {keychain}:[/] {stderr}"
                     )
 
+        # What's left is the search list setup starts from
+        self._keychain_list = keychains
+
     def _run_codesign(
         self,
         binary: Path,
@@ -418,6 +539,25 @@ class CertHandler:
         self.console.log(f"\n[blue]Signing binary:[/] {binary}")
         self._run_codesign(binary, entitlements)
 
+    def sign_binaries(self, jobs: List[Tuple[Path, Optional[Path]]]) -> None:
+        """Sign several binaries at once, given (binary, entitlements) pairs.
+
+        Binaries at the same depth run codesign concurrently; deeper ones are
+        signed first so nested code is sealed before what contains it.
+        """
+        levels = defaultdict(list)
+        for binary, entitlements in jobs:
+            levels[len(binary.parts)].append((binary, entitlements))
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            for depth in sorted(levels, reverse=True):
+                futures = [
+                    executor.submit(self.sign_binary, binary, entitlements)
+                    for binary, entitlements in levels[depth]
+                ]
+                for future in futures:
+                    future.result()
+
     def verify_binary(self, binary: Path) -> None:
         """Verify binary signature"""
         try:
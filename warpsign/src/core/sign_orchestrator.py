@@ -37,8 +37,8 @@ class SignOrchestrator:
         if cert_dir:
             cert_dir = Path(cert_dir)
 
-        # Initialize cert handler with configuration
-        self.cert_handler = CertHandler(cert_type=cert_type, cert_dir=cert_dir)
+        # Initialize cert handler with configuration, reusing a live keychain
+        self.cert_handler = CertHandler.get(cert_type=cert_type, cert_dir=cert_dir)
 
         # Rest of initialization based on certificate type
         cert_name = self.cert_handler.cert_common_name
@@ -361,6 +361,7 @@ class SignOrchestrator:
     def _update_info_plists(self, inspector: IPAInspector, components, bundle_plans):
         """Update Info.plist files using the single bundle mapper"""
 
+        plist_components = []
         for component in components:
             if not component.is_primary:
                 continue
@@ -370,7 +371,6 @@ class SignOrchestrator:
             if not plan:
                 continue
 
-            # Update Info.plist using patcher and our single bundle mapper
             info_plist_path = inspector.app_dir / component.path / "Info.plist"
             self.console.print(f"[blue]Updating Info.plist:[/] {info_plist_path}")
 
@@ -380,18 +380,17 @@ class SignOrchestrator:
 
             # Convert to standard dict for diffing (handles special types like Data)
             original_dict = plist_to_diffable_dict(original_plist)
+            plist_components.append((component, info_plist_path, original_dict))
 
-            # Update the plist
-            self.patcher.patch_info_plist(
-                info_plist_path,
-                bundle_mapper=self.bundle_mapper,  # Use our single source of truth
-                is_main_app=(component.path == Path(".")),
-            )
-
-            # Load the updated plist content
-            with open(info_plist_path, "rb") as f:
-                updated_plist = plistlib.load(f)
+        # Update the plists using patcher and our single bundle mapper
+        updated_plists = self.patcher.patch_many(
+            [(path, "plist") for _, path, _ in plist_components],
+            bundle_mapper=self.bundle_mapper,  # Use our single source of truth
+        )
 
+        for (component, _, original_dict), updated_plist in zip(
+            plist_components, updated_plists
+        ):
             # Convert to standard dict for diffing
             updated_dict = plist_to_diffable_dict(updated_plist)
 
@@ -554,23 +553,31 @@ class SignOrchestrator:
             c for c in framework_components if c.executable.name not in KNOWN_DYLIBS
         ]
 
-        # Sign dylibs first
+        # Collect dylibs first
+        framework_jobs = []
         for dylib_name, component in dylibs.items():
             if component:
                 binary_path = inspector.app_dir / component.executable
                 self.console.print(
                     f"[blue]Signing {KNOWN_DYLIBS[dylib_name]}:[/] {binary_path}"
                 )
-                self.cert_handler.sign_binary(binary_path, None, False)
+                framework_jobs.append((binary_path, None))
 
         # Handle remaining frameworks
+        framework_binaries = []
         for component in other_frameworks:
             binary_path = inspector.app_dir / component.executable
-            self.console.print(
-                f"[blue]Patching and signing framework:[/] {binary_path}"
-            )
-            self.patcher.patch_app_binary(binary_path, self.bundle_mapper)
-            self.cert_handler.sign_binary(binary_path, None, False)
+            framework_binaries.append((binary_path, "binary"))
+            framework_jobs.append((binary_path, None))
+
+        # Frameworks are patched independently, so do them concurrently too;
+        # each one's log is printed as a block once it is done
+        if framework_binaries:
+            self.console.print(f"[blue]Patching {len(framework_binaries)} frameworks[/]")
+            self.patcher.patch_many(framework_binaries, self.bundle_mapper)
+
+        # Frameworks don't depend on each other, so codesign them concurrently
+        self.cert_handler.sign_binaries(framework_jobs)
 
         # Sort primary components by path depth (deepest first)
         primary_components = sorted(
@@ -1,5 +1,7 @@
+import os
 import plistlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
 from warpsign.logger import get_console
@@ -237,17 +239,16 @@ class SigningVerifier:
 
         return all_critical_valid, results
 
-    def _verify_code_signature(self, path: Path) -> Tuple[bool, str]:
+    def _verify_code_signature(self, path: Path, deep: bool = True) -> Tuple[bool, str]:
         """Verify the code signature of an app or component.
         Returns a tuple of (is_valid, error_message)
         """
+        cmd = ["codesign", "--verify", "--strict", str(path)]
+        if deep:
+            # Also verify all nested code
+            cmd.insert(2, "--deep")
         try:
-            # Perform deep verification with strict checks
-            subprocess.run(
-                ["codesign", "--verify", "--deep", "--strict", str(path)],
-                capture_output=True,
-                check=True,
-            )
+            subprocess.run(cmd, capture_output=True, check=True)
             return True, ""
         except subprocess.CalledProcessError as e:
             error_output = e.stderr.decode("utf-8").strip()
@@ -266,8 +267,22 @@ class SigningVerifier:
             )
             self.console.print("=" * 80)
 
+            # Run codesign on the bundle and every component binary
+            # concurrently, then report the results in order
+            binary_paths = [app_dir / c.executable for c in components]
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                bundle_result = executor.submit(self._verify_code_signature, app_dir)
+                # The bundle check is already deep, so each binary only needs
+                # its own signature checked rather than re-walking its nested code
+                component_results = list(
+                    executor.map(
+                        lambda path: self._verify_code_signature(path, deep=False),
+                        binary_paths,
+                    )
+                )
+
             # First verify the main app bundle
-            is_valid, error = self._verify_code_signature(app_dir)
+            is_valid, error = bundle_result.result()
             if is_valid:
                 self.console.print("[green]✓ Main app bundle signature is valid[/]")
             else:
@@ -282,14 +297,8 @@ class SigningVerifier:
                     component.path if str(component.path) != "." else "Main App Binary"
                 )
 
-                component_path = app_dir
-                if component.path != Path("."):
-                    component_path = app_dir / component.path
-
-                binary_path = app_dir / component.executable
-
                 # Verify the component's binary
-                is_valid, error = self._verify_code_signature(binary_path)
+                is_valid, error = component_results[idx]
                 if is_valid:
                     self.console.print(
                         f"[green]✓ {component_name} signature is valid[/]"
@@ -324,6 +333,24 @@ class SigningVerifier:
             )
             self.console.print("=" * 80)
 
+            # Read every binary's and profile's entitlements concurrently
+            binary_paths = []
+            profile_paths = []
+            for component in primary_components:
+                binary_paths.append(inspector.app_dir / component.executable)
+                profile_paths.append(
+                    inspector.app_dir / component.path / "embedded.mobileprovision"
+                )
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                binary_futures = [
+                    executor.submit(self._get_binary_entitlements, path)
+                    for path in binary_paths
+                ]
+                profile_futures = [
+                    executor.submit(self._get_profile_entitlements, path)
+                    for path in profile_paths
+                ]
+
             for idx, component in enumerate(primary_components):
                 component_name = (
                     component.path if str(component.path) != "." else "Main App"
@@ -335,16 +362,8 @@ class SigningVerifier:
                 )
                 self.console.print("-" * 80)
 
-                binary_path = inspector.app_dir / component.executable
-                if component.path == Path("."):
-                    profile_path = inspector.app_dir / "embedded.mobileprovision"
-                else:
-                    profile_path = (
-                        inspector.app_dir / component.path / "embedded.mobileprovision"
-                    )
-
-                binary_ents = self._get_binary_entitlements(binary_path)
-                profile_ents = self._get_profile_entitlements(profile_path)
+                binary_ents = binary_futures[idx].result()
+                profile_ents = profile_futures[idx].result()
 
                 component_valid, results = self._compare_entitlements(
                     binary_ents, profile_ents, str(component.path)
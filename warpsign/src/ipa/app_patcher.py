@@ -1,16 +1,23 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Set, Optional, Union
+from typing import Dict, Iterator, List, Set, Optional, Tuple, Union
 import plistlib
 import subprocess
 import shutil
-from collections import OrderedDict
-import lief
-from lief import MachO
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum, auto
+from rich.console import Console
+from rich.text import Text
 from warpsign.logger import get_console
+import io
 import json
+import mmap
 import os
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 
 from warpsign.src.utils.icon_handler import IconHandler
 from warpsign.src.core.bundle_mapper import BundleMapping, IDType
@@ -56,6 +63,9 @@ class PatchingOptions:
     patch_user_interface_style: UIStyle = UIStyle.AUTOMATIC  # Force UI style
     remove_url_schemes: bool = False  # Remove URL schemes registration
 
+    # Logging
+    verbose_patching: bool = False  # Log every ID replacement, not just totals
+
     # Liquid Glass patch
     patch_liquid_glass: bool = False  # Force Liquid Glass build metadata
 
@@ -64,16 +74,72 @@ class PatchingOptions:
     hide_home_indicator: bool = False  # Hide home indicator on iPhone X and newer
 
 
-class OrderPreservingDict(OrderedDict):
-    """Special dictionary that preserves key order for plists"""
+# Files patch_many works on at once; each LIEF pass holds a whole Mach-O in
+# memory, so this stays small even on machines with many cores
+PATCH_WORKERS = 4
+
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+@lru_cache(maxsize=32)
+def _compile_byte_patterns(patterns: tuple) -> re.Pattern:
+    """Compile byte patterns into one alternation, longest first"""
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile(b"|".join(re.escape(p) for p in ordered))
 
-    def __eq__(self, other):
-        if isinstance(other, dict):
-            return dict(self) == dict(other)
-        return super().__eq__(other)
+
+def _replace_in_buffer(
+    replacements: Dict[str, str], buf: Union[bytearray, mmap.mmap]
+) -> Dict[str, int]:
+    """Overwrite same-length patterns in a writable buffer in a single scan"""
+    # Convert strings to bytes for binary replacement
+    encoded = {}
+    for old, new in replacements.items():
+        old_bytes = old.encode("utf-8")
+        new_bytes = new.encode("utf-8")
+        if len(old_bytes) != len(new_bytes):
+            raise ValueError(
+                f"Replacement lengths must match: {old} ({len(old_bytes)}) -> {new} ({len(new_bytes)})"
+            )
+        encoded[old_bytes] = (old, new_bytes)
+
+    counts = dict.fromkeys(replacements, 0)
+    if not encoded:
+        return counts
+
+    # Every pattern is matched in a single scan; longer patterns win over
+    # any they contain at the same position
+    regex = _compile_byte_patterns(tuple(encoded))
+    for match in regex.finditer(buf):
+        old, new_bytes = encoded[match.group()]
+        buf[match.start() : match.end()] = new_bytes
+        counts[old] += 1
+
+    return counts
+
+
+@contextmanager
+def _map_file(f) -> Iterator[Optional[mmap.mmap]]:
+    """Map an open file for in-place writes, yielding None when it is empty"""
+    if os.fstat(f.fileno()).st_size == 0:
+        yield None
+        return
+    with mmap.mmap(f.fileno(), 0) as mm:
+        # Patterns are found in one front-to-back scan, so ask for readahead
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        yield mm
+
+
+@lru_cache(maxsize=8)
+def _compile_replacement_filter(team_ids: frozenset) -> re.Pattern:
+    """Compile the IDs kept when the original bundle ID is forced"""
+    alternatives = [
+        r"\AiCloud\.",  # iCloud IDs
+        r"\Agroup\.",  # App group IDs
+        r"\A(?=[0-9]*[A-Z])[A-Z0-9]{10}\Z",  # Team IDs format
+    ]
+    # Known team IDs anywhere in the key
+    alternatives.extend(re.escape(tid) for tid in sorted(team_ids))
+    return re.compile("|".join(alternatives))
 
 
 class AppPatcher:
@@ -87,8 +153,12 @@ class AppPatcher:
     ):
         self.app_dir = app_dir
         self.opts = opts
-        self.console = get_console()
+        self._console = get_console()
+        # Holds a buffered console for each patch_many worker thread
+        self._thread_state = threading.local()
         self.bundle_mapper = bundle_mapper
+        # Filtered binary patches, keyed by mapper and main bundle ID
+        self._patterns_cache: Dict[tuple, Dict[str, str]] = {}
         self.plugins_dylib = (
             Path(__file__).parent.parent / "patches" / "WarpsignFix.dylib"
         )
@@ -110,6 +180,11 @@ class AppPatcher:
                     f"Plugins UI patcher dylib not found: {self.plugins_ui_dylib}"
                 )
 
+    @property
+    def console(self) -> Console:
+        """The shared console, or the current file's buffer inside patch_many"""
+        return getattr(self._thread_state, "console", None) or self._console
+
     def clean_app_bundle(self, app_dir: Path) -> None:
         """Remove unnecessary app bundle components"""
         self.console.log("[blue]Cleaning app bundle[/]")
@@ -137,28 +212,55 @@ class AppPatcher:
         if not self.opts.force_original_id:
             return replacements
 
-        filtered = {}
         original_bundle_id = getattr(self, "main_bundle_id", "")
 
         # Get original team IDs from bundle mapper if available
-        original_team_ids = set()
+        original_team_ids = frozenset()
         if hasattr(self, "bundle_mapper") and hasattr(
             self.bundle_mapper, "original_team_ids"
         ):
-            original_team_ids = set(self.bundle_mapper.original_team_ids)
+            original_team_ids = frozenset(self.bundle_mapper.original_team_ids)
+
+        # iCloud, group and team IDs match the compiled filter; anything not
+        # under the original bundle ID is kept as well
+        keep = _compile_replacement_filter(original_team_ids).search
+        return {
+            k: v
+            for k, v in replacements.items()
+            if keep(k) or (original_bundle_id and not k.startswith(original_bundle_id))
+        }
 
-        for k, v in replacements.items():
-            if (
-                k.startswith(("iCloud.", "group."))  # iCloud and group IDs
-                or (k.isupper() and k.isalnum() and len(k) == 10)  # Team IDs format
-                or any(tid in k for tid in original_team_ids)  # Known team IDs
-                or (
-                    original_bundle_id and not k.startswith(original_bundle_id)
-                )  # Non-bundle IDs
-            ):
-                filtered[k] = v
+    def _binary_patterns(
+        self, bundle_mapper: Union[BundleMapping, Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Get the filtered replacements to apply, longest pattern first.
 
-        return filtered
+        Mappings are complete before any file is patched, so a mapper's patterns
+        are worked out once per main bundle ID and shared by every file.
+        """
+        if not isinstance(bundle_mapper, BundleMapping):
+            return self._sort_patterns(self._filter_replacements(bundle_mapper))
+
+        key = (bundle_mapper, getattr(self, "main_bundle_id", ""))
+        patterns = self._patterns_cache.get(key)
+        if patterns is None:
+            replacements = bundle_mapper.get_binary_patches()
+            patterns = self._sort_patterns(self._filter_replacements(replacements))
+            self._patterns_cache[key] = patterns
+        return patterns
+
+    @staticmethod
+    def _sort_patterns(replacements: Dict[str, str]) -> Dict[str, str]:
+        """Order replacements by decreasing length to avoid partial matches"""
+        # Bucket by length so only the distinct lengths need sorting
+        by_length = defaultdict(list)
+        for old, new in replacements.items():
+            by_length[len(old)].append((old, new))
+        return {
+            old: new
+            for length in sorted(by_length, reverse=True)
+            for old, new in by_length[length]
+        }
 
     def _get_allowed_id_types(self) -> Set[IDType]:
         """Get allowed ID types based on patching options"""
@@ -174,8 +276,9 @@ class AppPatcher:
         """Patch an Info.plist with configured options"""
         self.console.log(f"[blue]Patching Info.plist:[/] {info_plist}")
 
-        with open(info_plist, "rb") as f:
-            info = plistlib.load(f, dict_type=OrderPreservingDict)
+        original = info_plist.read_bytes()
+        # Plain dicts keep the plist's key order
+        info = plistlib.loads(original)
 
         # Handle bundle mapping first (existing code)
         if bundle_mapper:
@@ -335,74 +438,45 @@ class AppPatcher:
                 self.console.log("[green]Removing URL schemes registration")
                 info.pop("CFBundleURLTypes")
 
-        # Write changes back
-        with open(info_plist, "wb") as f:
-            plistlib.dump(info, f, sort_keys=False)
+        # Serialize the changes; binary patches are applied to the same buffer
+        # so the file is written at most once
+        data = bytearray(plistlib.dumps(info, sort_keys=False))
 
         # Rest of the existing code for binary patches
         if self.opts.patch_ids and bundle_mapper:
-            replacements = bundle_mapper.get_binary_patches()
-            if replacements:
-                filtered_replacements = self._filter_replacements(replacements)
-                if filtered_replacements:
-                    self.console.log(
-                        f"[blue]Binary patching Info.plist:[/] {info_plist}"
-                    )
-                    total_replacements = 0
-
-                    # Sort by decreasing length to avoid partial matches
-                    patterns = sorted(
-                        filtered_replacements.items(),
-                        key=lambda x: len(x[0]),
-                        reverse=True,
-                    )
-
-                    for old, new in patterns:
-                        self.console.log(f"[green]Replacing:[/] {old} -> {new}")
-                        count = self.binary_replace(f"s/{old}/{new}/g", info_plist)
-                        total_replacements += count
-                        self.console.log(f"[blue]Made {count} replacements[/]")
-                    self.console.log(
-                        f"[blue]Total replacements in plist:[/] {total_replacements}"
-                    )
+            patterns = self._binary_patterns(bundle_mapper)
+            if patterns:
+                self.console.log(f"[blue]Binary patching Info.plist:[/] {info_plist}")
+                counts = _replace_in_buffer(patterns, data)
+                self._log_replacements(patterns, counts, "plist")
+                # Return what was written, including the patched IDs
+                if any(counts.values()):
+                    info = plistlib.loads(bytes(data))
+
+        # Write changes back, leaving the file alone if nothing changed
+        if data != original:
+            info_plist.write_bytes(data)
 
         return info
 
-    def binary_replace(self, pattern: str, file: Path) -> int:
-        """Replace binary patterns in file and return count of replacements"""
+    def replace_all(self, replacements: Dict[str, str], file: Path) -> Dict[str, int]:
+        """Replace several same-length patterns in one pass over a file.
+
+        Returns the number of replacements made for each pattern.
+        """
         if not file.exists() or not file.is_file():
             raise Exception(f"File does not exist or is not a file: {file}")
 
-        # Parse the perl-style pattern
-        if not pattern.startswith("s/") or pattern.count("/") != 3:
-            raise ValueError(f"Invalid pattern format: {pattern}")
-        _, old, new, flags = pattern.split("/")
-
-        # Read file as binary
-        with open(file, "rb") as f:
-            content = f.read()
-
-        # Convert strings to bytes for binary replacement
-        old_bytes = old.encode("utf-8")
-        new_bytes = new.encode("utf-8")
-
-        if len(old_bytes) != len(new_bytes):
-            raise ValueError(
-                f"Replacement lengths must match: {old} ({len(old_bytes)}) -> {new} ({len(new_bytes)})"
-            )
-
-        # Count occurrences before replacement
-        count = content.count(old_bytes)
+        # Patterns and replacements are the same length, so matches are
+        # overwritten in place through a mapping of the file
+        with open(file, "r+b") as f, _map_file(f) as mm:
+            if mm is None:
+                return dict.fromkeys(replacements, 0)
+            counts = _replace_in_buffer(replacements, mm)
+            if any(counts.values()):
+                mm.flush()
 
-        if count > 0:
-            # Perform replacement
-            new_content = content.replace(old_bytes, new_bytes)
-
-            # Write back only if changes were made
-            with open(file, "wb") as f:
-                f.write(new_content)
-
-        return count
+        return counts
 
     def patch_binary(
         self,
@@ -415,35 +489,30 @@ class AppPatcher:
             self.console.log("[yellow]Binary patching disabled - skipping")
             return
 
-        # Get filtered replacements
-        if isinstance(bundle_mapper, BundleMapping):
-            replacements = bundle_mapper.get_binary_patches()
-        else:
-            replacements = bundle_mapper
-
-        # Apply the same filtering logic as used for plists
-        filtered_patches = self._filter_replacements(replacements)
+        # Get filtered replacements, applying the same filtering as for plists
+        patterns = self._binary_patterns(bundle_mapper)
 
         # Verify all replacements are same length
-        invalid = [
-            f"{k} -> {v}" for k, v in filtered_patches.items() if len(k) != len(v)
-        ]
+        invalid = [f"{k} -> {v}" for k, v in patterns.items() if len(k) != len(v)]
         if invalid:
             raise ValueError(f"Replacement length mismatch: {', '.join(invalid)}")
 
-        # Sort by decreasing length to avoid partial matches
-        patterns = sorted(
-            filtered_patches.items(), key=lambda x: len(x[0]), reverse=True
-        )
+        counts = self.replace_all(patterns, binary)
+        self._log_replacements(patterns, counts, "binary")
 
-        total_replacements = 0
-        for old, new in patterns:
-            self.console.log(f"[green]Replacing:[/] {old} -> {new}")
-            count = self.binary_replace(f"s/{old}/{new}/g", binary)
-            total_replacements += count
-            self.console.log(f"[blue]Made {count} replacements[/]")
+    def _log_replacements(
+        self, patterns: Dict[str, str], counts: Dict[str, int], target: str
+    ) -> None:
+        """Log the replacement total, and each pattern's count when verbose"""
+        if self.opts.verbose_patching:
+            for old, new in patterns.items():
+                self.console.log(f"[green]Replacing:[/] {old} -> {new}")
+                self.console.log(f"[blue]Made {counts[old]} replacements[/]")
 
-        self.console.log(f"[blue]Total replacements in binary:[/] {total_replacements}")
+        total_replacements = sum(counts.values())
+        self.console.log(
+            f"[blue]Total replacements in {target}:[/] {total_replacements}"
+        )
 
     def get_dylib_path(self, binary_path: Path, dylib_name: str) -> Optional[str]:
         """
@@ -481,31 +550,26 @@ class AppPatcher:
         self.console.log(f"[red]Could not find .app bundle in path:[/] {binary_path}")
         return None
 
-    def inject_dylib_with_lief(self, binary_path: Path, dylib_name: str) -> None:
-        """Inject a dylib into a Mach-O binary using LIEF"""
-        self.console.log(f"[blue]Injecting {dylib_name} with LIEF[/]")
+    def _parse_macho(self, binary_path: Path) -> tuple:
+        """Parse a Mach-O with LIEF, returning it and its architecture slices"""
+        # LIEF is large and slow to import, so only load it once a binary
+        # actually needs its load commands edited
+        from lief import MachO
 
-        # Parse binary
         parsed = MachO.parse(str(binary_path))
-
-        # Handle fat binary
         if isinstance(parsed, MachO.FatBinary):
             self.console.log("[blue]Found Fat Binary - processing all architectures")
-            binaries = [parsed.at(i) for i in range(parsed.size)]
-        else:
-            binaries = [parsed]
-
-        # Process each binary
-        for binary in binaries:
-            # Check encryption status
-            if binary.has_encryption_info and binary.encryption_info.crypt_id != 0:
-                self.console.log("[red]Error: Binary is encrypted![/]")
-                self.console.log(
-                    "[yellow]App must be decrypted first (check AppStore DRM)"
-                )
-                raise ValueError("Cannot modify encrypted binary")
-            else:
-                self.console.log("[green]Binary is not encrypted, proceeding")
+            return parsed, [parsed.at(i) for i in range(parsed.size)]
+        return parsed, [parsed]
+
+    def _add_dylibs(
+        self, binaries: list, binary_path: Path, dylib_names: List[str]
+    ) -> List[str]:
+        """Add a load command for each dylib to every slice, returning those added"""
+        # The load path only depends on where the binary sits in the bundle
+        dylib_paths = {}
+        for dylib_name in dylib_names:
+            self.console.log(f"[blue]Injecting {dylib_name} with LIEF[/]")
 
             # Get the optimal dylib path
             dylib_path = self.get_dylib_path(binary_path, dylib_name)
@@ -518,42 +582,44 @@ class AppPatcher:
                 continue
 
             self.console.log(f"[green]Using path:[/] {dylib_path}")
+            dylib_paths[dylib_name] = dylib_path
 
-            # Add LC_LOAD_DYLIB command using the determined path
-            binary.add_library(dylib_path)
+        # Process each binary
+        for binary in binaries:
+            # Check encryption status
+            if binary.has_encryption_info and binary.encryption_info.crypt_id != 0:
+                self.console.log("[red]Error: Binary is encrypted![/]")
+                self.console.log(
+                    "[yellow]App must be decrypted first (check AppStore DRM)"
+                )
+                raise ValueError("Cannot modify encrypted binary")
+            else:
+                self.console.log("[green]Binary is not encrypted, proceeding")
 
-        # Write modified binary
-        parsed.write(str(binary_path))
-        self.console.log(
-            f"[green]Injected {dylib_name} successfully with path {dylib_path}[/]"
-        )
+            # Add LC_LOAD_DYLIB commands using the determined paths
+            for dylib_path in dylib_paths.values():
+                binary.add_library(dylib_path)
 
-    def check_and_remove_conflicting_dylibs(self, binary_path: Path) -> bool:
-        """Check for and remove conflicting dylibs in a binary"""
-        if not self.opts.inject_warpsign_fix:
-            return False  # No conflicts if we're not injecting our own plugins
+        for dylib_name, dylib_path in dylib_paths.items():
+            self.console.log(
+                f"[green]Injected {dylib_name} successfully with path {dylib_path}[/]"
+            )
 
-        self.console.log(f"[blue]Checking for conflicting dylibs in:[/] {binary_path}")
+        return list(dylib_paths)
 
-        # Parse binary
-        parsed = MachO.parse(str(binary_path))
+    def _remove_conflicting_dylibs(self, binaries: list) -> bool:
+        """Remove conflicting dylib load commands from each slice"""
+        from lief import MachO
 
         # Track whether we removed anything
         removed_dylibs = False
 
-        # Handle fat binary
-        if isinstance(parsed, MachO.FatBinary):
-            self.console.log("[blue]Found Fat Binary - processing all architectures")
-            binaries = [parsed.at(i) for i in range(parsed.size)]
-        else:
-            binaries = [parsed]
-
         # Process each binary
         for binary in binaries:
             # Check if binary has conflicting dylibs
             for i, command in enumerate(binary.commands):
                 # Check if it's a dylib command using command type comparison
-                if isinstance(command, lief.MachO.DylibCommand):
+                if isinstance(command, MachO.DylibCommand):
                     # Check if any of the conflicting dylib names are in the command's name
                     if any(dylib in command.name for dylib in CONFLICTING_DYLIBS):
                         self.console.log(
@@ -568,60 +634,61 @@ class AppPatcher:
                         removed_dylibs = True
                         break
 
-        # Write modified binary if changes were made
         if removed_dylibs:
             self.console.log("[green]Removed conflicting dylibs from binary")
-            parsed.write(str(binary_path))
         else:
             self.console.log("[green]No conflicting dylibs found")
 
         return removed_dylibs
 
     # This is for Liquid Glass.
-    def patch_build_version(self, binary_path: Path) -> None:
-        """Force LC_BUILD_VERSION to iOS platform with minos 12.0 and SDK 26.0 (Liquid Glass)"""
-
-        self.console.log(f"[blue]Patching BuildVersion command in:[/] {binary_path}")
-
-        parsed = MachO.parse(str(binary_path))
-
-        # Handle fat vs thin binaries
-        if isinstance(parsed, MachO.FatBinary):
-            binaries = [parsed.at(i) for i in range(parsed.size)]
-        else:
-            binaries = [parsed]
-
-        for binary in binaries:
-            if not binary.has_build_version:
-                self.console.log("[yellow]No LC_BUILD_VERSION found, skipping[/]")
-                continue
-
-            build_ver = binary.build_version
-
-            # Log previous values for transparency
-            old_minos = ".".join(map(str, build_ver.minos))
-            old_sdk = ".".join(map(str, build_ver.sdk))
-
-            # Update values to iOS 12.0 and iOS 26.0
-            build_ver.minos = (12, 0, 0)
-            build_ver.sdk = (26, 0, 0)
-
-            # Ensure platform is iOS (value 2) if not already
-            try:
-                import lief
+    def _patch_build_version(self, binaries: list) -> None:
+        """Force the build version of each slice to iOS 12.0 / SDK 26.0"""
+        from lief import MachO
+
+        # Original values of slices already updated, restored if a later slice
+        # fails so the caller never writes a half-patched binary
+        updated = []
+        try:
+            for binary in binaries:
+                if not binary.has_build_version:
+                    self.console.log("[yellow]No LC_BUILD_VERSION found, skipping[/]")
+                    continue
+
+                build_ver = binary.build_version
+
+                # Log previous values for transparency
+                old_minos = ".".join(map(str, build_ver.minos))
+                old_sdk = ".".join(map(str, build_ver.sdk))
+                updated.append(
+                    (build_ver, build_ver.minos, build_ver.sdk, build_ver.platform)
+                )
 
-                if build_ver.platform != lief.MachO.BuildVersion.PLATFORMS.IOS:
-                    build_ver.platform = lief.MachO.BuildVersion.PLATFORMS.IOS
-            except Exception:
-                # Platform update is best-effort. Continue even if not supported.
-                pass
+                # Update values to iOS 12.0 and iOS 26.0
+                build_ver.minos = (12, 0, 0)
+                build_ver.sdk = (26, 0, 0)
 
-            self.console.log(
-                f"[green]BuildVersion updated (minos {old_minos} -> 12.0, sdk {old_sdk} -> 26.0)[/]"
-            )
+                # Ensure platform is iOS (value 2) if not already
+                try:
+                    if build_ver.platform != MachO.BuildVersion.PLATFORMS.IOS:
+                        build_ver.platform = MachO.BuildVersion.PLATFORMS.IOS
+                except Exception:
+                    # Platform update is best-effort. Continue even if not supported.
+                    pass
 
-        # Write back modified binary (this rebuilds fat if needed)
-        parsed.write(str(binary_path))
+                self.console.log(
+                    f"[green]BuildVersion updated (minos {old_minos} -> 12.0, sdk {old_sdk} -> 26.0)[/]"
+                )
+        except Exception:
+            for build_ver, minos, sdk, platform in updated:
+                build_ver.minos = minos
+                build_ver.sdk = sdk
+                try:
+                    build_ver.platform = platform
+                except Exception:
+                    # Platform is only changed best-effort, so may not be settable
+                    pass
+            raise
 
     def patch_app_binary(
         self,
@@ -650,16 +717,15 @@ class AppPatcher:
             with open(entitlements_path, "wb") as f:
                 plistlib.dump(entitlements, f)
 
-        # Apply ID replacements if needed
+        # Apply ID replacements if needed; these patch the file in place
+        # before LIEF parses it below
         if self.opts.patch_ids and bundle_mapper:
             # Get patches from bundle mapper
-            replacements = bundle_mapper.get_binary_patches()
-            if replacements:
-                self.patch_binary(app_binary, replacements)
+            if self._binary_patterns(bundle_mapper):
+                self.patch_binary(app_binary, bundle_mapper)
 
-        # Check for and remove conflicting dylibs before injecting our own
-        if self.opts.inject_warpsign_fix:
-            self.check_and_remove_conflicting_dylibs(app_binary)
+        # Dylibs to inject, with the name used when reporting a failure
+        injections = []
 
         # Inject plugins patcher dylib if enabled (into all binaries)
         if self.opts.inject_warpsign_fix:
@@ -669,39 +735,131 @@ class AppPatcher:
                     f"[yellow]Skipping dylib injection into {app_binary.name} as it is a dylib itself[/]"
                 )
             else:
-                dylib_name = self.plugins_dylib.name
-                try:
-                    self.inject_dylib_with_lief(app_binary, dylib_name)
-                except Exception as e:
-                    self.console.log(f"[red]Failed to inject plugins dylib: {e}[/]")
-                    raise
+                injections.append((self.plugins_dylib.name, "plugins dylib"))
 
             # Inject UI dylib only into main binary
             if is_main_binary:
-                ui_dylib_name = self.plugins_ui_dylib.name
-                try:
-                    self.console.log(f"[blue]Injecting UI dylib into main binary[/]")
-                    self.inject_dylib_with_lief(app_binary, ui_dylib_name)
-                except Exception as e:
-                    self.console.log(f"[red]Failed to inject UI plugins dylib: {e}[/]")
-                    raise
+                injections.append((self.plugins_ui_dylib.name, "UI plugins dylib"))
 
         # Inject home indicator dylib if enabled (only into main binary)
         if is_main_binary and self.opts.hide_home_indicator:
-            dylib_name = self.home_indicator_dylib.name
+            injections.append((self.home_indicator_dylib.name, "home indicator dylib"))
+
+        # Apply Liquid Glass build_version patch only to the main binary
+        patch_build = is_main_binary and self.opts.patch_liquid_glass
+
+        if not (self.opts.inject_warpsign_fix or injections or patch_build):
+            return
+
+        # Make every load command change on a single parse of the binary,
+        # injecting all of the dylibs together
+        parsed, binaries = self._parse_macho(app_binary)
+        modified = False
+
+        # Check for and remove conflicting dylibs before injecting our own
+        if self.opts.inject_warpsign_fix:
+            self.console.log(
+                f"[blue]Checking for conflicting dylibs in:[/] {app_binary}"
+            )
+            modified = self._remove_conflicting_dylibs(binaries)
+
+        if injections:
             try:
-                self.inject_dylib_with_lief(app_binary, dylib_name)
+                added = self._add_dylibs(
+                    binaries, app_binary, [name for name, _ in injections]
+                )
             except Exception as e:
-                self.console.log(f"[red]Failed to inject home indicator dylib: {e}[/]")
+                failed = ", ".join(description for _, description in injections)
+                self.console.log(f"[red]Failed to inject {failed}: {e}[/]")
                 raise
-
-        # Apply Liquid Glass build_version patch only to the main binary
-        if is_main_binary and self.opts.patch_liquid_glass:
+            for name, description in injections:
+                if name not in added:
+                    self.console.log(f"[red]Failed to inject {description}: {name}[/]")
+            # Leave the binary untouched if no dylib could be injected
+            modified = modified or bool(added)
+
+        if patch_build:
+            self.console.log(f"[blue]Patching BuildVersion command in:[/] {app_binary}")
             try:
-                self.patch_build_version(app_binary)
+                self._patch_build_version(binaries)
+                modified = True
             except Exception as e:
                 self.console.log(f"[red]Failed to patch build_version: {e}[/]")
 
+        # Write all changes back at once (this rebuilds fat if needed)
+        if modified:
+            parsed.write(str(app_binary))
+
+    def patch_many(
+        self,
+        files: List[Tuple[Path, str]],
+        bundle_mapper: Optional[BundleMapping] = None,
+    ) -> List[Optional[Dict]]:
+        """Patch several files concurrently, given (path, kind) pairs.
+
+        Kind is "plist" for an Info.plist or "binary" for a framework binary.
+        The main app's Info.plist sets main_bundle_id, so it is patched first;
+        the rest are independent. Returns each patched plist, or None for binaries.
+        Every file's log is printed even if another fails; the first failure is
+        raised once all of them are done.
+        """
+        main_plist = self.app_dir / "Info.plist"
+        results: List[Optional[Dict]] = [None] * len(files)
+        pending = []
+        for i, (path, kind) in enumerate(files):
+            if kind == "plist" and path == main_plist:
+                results[i] = self.patch_info_plist(path, bundle_mapper, True)
+            else:
+                pending.append(i)
+
+        # Each file logs to its own buffer, printed as one block per file in
+        # order, so output from concurrent files never interleaves
+        logs = dict.fromkeys(pending, "")
+        workers = min(PATCH_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                i: executor.submit(self._patch_file, *files[i], bundle_mapper, logs, i)
+                for i in pending
+            }
+            wait(futures.values())
+
+        error = None
+        for i, future in futures.items():
+            self._console.print(Text.from_ansi(logs[i]), end="")
+            if future.exception() is None:
+                results[i] = future.result()
+            elif error is None:
+                error = future.exception()
+        if error is not None:
+            raise error
+
+        return results
+
+    def _patch_file(
+        self,
+        path: Path,
+        kind: str,
+        bundle_mapper: Optional[BundleMapping],
+        logs: Dict[int, str],
+        index: int,
+    ) -> Optional[Dict]:
+        """Patch a single file for patch_many, logging into logs[index]"""
+        buffer = io.StringIO()
+        self._thread_state.console = Console(
+            file=buffer,
+            force_terminal=self._console.is_terminal,
+            color_system=self._console.color_system,
+            width=self._console.width,
+        )
+        try:
+            if kind == "plist":
+                return self.patch_info_plist(path, bundle_mapper)
+            self.patch_app_binary(path, bundle_mapper)
+            return None
+        finally:
+            self._thread_state.console = None
+            logs[index] = buffer.getvalue()
+
     def generate_remappings_json(self) -> None:
         """Generate remappings.json file for plugins dylib"""
         if not self.opts.inject_warpsign_fix or not self.bundle_mapper: